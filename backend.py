@@ -1,33 +1,177 @@
 import subprocess
+import bisect
 import os
 import sys
 import platform
 import multiprocessing
 import concurrent.futures
+import contextlib
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Callable
-from dataclasses import dataclass
-from enum import Enum
+from typing import Dict, Iterator, List, NamedTuple, Sequence, Tuple, Optional, Callable
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from enum import IntEnum
+import re
+import mmap
 import time
 import shutil
+import functools
+import hashlib
+import itertools
+import json
+import threading
+import importlib.util
 
-class ThreatLevel(Enum):
-    SAFE = "safe"
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+# Stands in for a missing progress callback, so scan steps can report unconditionally
+def _NOOP(*_args) -> None:
+    pass
 
-@dataclass
+# The platform never changes while running, so it is looked up once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_MAC = _SYSTEM == "Darwin"
+
+# Options for every pdfid subprocess
+_POPEN_KWARGS = {
+    'stdout': subprocess.PIPE,
+    'stderr': subprocess.PIPE
+}
+if _IS_WINDOWS:
+    # On Windows, prevent console window from appearing
+    _POPEN_KWARGS['creationflags'] = subprocess.CREATE_NO_WINDOW
+
+# Scan timeouts by file size: up to 10MB -> 30s, 100MB -> 60s, 500MB -> 180s, larger -> 300s
+_TIMEOUT_LIMITS_MB = (10, 100, 500)
+_TIMEOUT_SECONDS = (30, 60, 180, 300)
+
+# Locations of pdfid.py relative to this file, as path components
+_RELATIVE_PDFID_CANDIDATES = (
+    ("src", "pdfid", "pdfid.py"),
+    ("pdfid", "pdfid.py"),
+    ("..", "src", "pdfid", "pdfid.py"),
+    ("..", "pdfid", "pdfid.py"),
+    ("tools", "pdfid.py"),
+    ("scripts", "pdfid.py")
+)
+
+# System-wide locations of pdfid.py, tried after ~/pdfid/pdfid.py
+_WINDOWS_PDFID_PATHS = (
+    Path("C:/Tools/pdfid/pdfid.py"),
+    Path("C:/Program Files/pdfid/pdfid.py"),
+    Path("C:/Program Files (x86)/pdfid/pdfid.py")
+)
+_MAC_PDFID_PATHS = (
+    Path("/usr/local/bin/pdfid.py"),
+    Path("/opt/homebrew/bin/pdfid.py"),
+    Path("/Applications/pdfid/pdfid.py")
+)
+_UNIX_PDFID_PATHS = (
+    Path("/usr/local/bin/pdfid.py"),
+    Path("/opt/pdfid/pdfid.py"),
+    Path("/usr/bin/pdfid.py")
+)
+
+
+def _probe_relative_candidates(base_dir: Path, candidates: Tuple[Tuple[str, ...], ...]) -> Optional[Path]:
+    """Return the first existing candidate, stat-ing only those whose top directory exists.
+    
+    Each directory involved is listed once with os.scandir, instead of one failed stat per candidate.
+    """
+    listings: Dict[Path, frozenset] = {}
+    for parts in candidates:
+        root = base_dir
+        while parts[0] == "..":
+            root, parts = root / "..", parts[1:]
+        if root not in listings:
+            try:
+                with os.scandir(root) as entries:
+                    listings[root] = frozenset(entry.name for entry in entries)
+            except OSError:
+                listings[root] = frozenset()
+        if parts[0] in listings[root]:
+            path = root.joinpath(*parts)
+            if path.is_file():
+                return path
+    return None
+
+
+class ThreatLevel(IntEnum):
+    """Threat levels, ordered so that higher values are more severe"""
+    SAFE = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+# Batch progress: (files done, total files, message)
+BatchProgressCallback = Callable[[int, int, str], None]
+
+class CancellationToken:
+    """Thread-safe flag a caller sets to stop a scan or batch early"""
+    __slots__ = ("_event",)
+    
+    def __init__(self):
+        self._event = threading.Event()
+    
+    def cancel(self) -> None:
+        self._event.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+class _ScanCancelled(Exception):
+    """Raised inside a scan when its cancellation token is set while the file is hashed or pdfid runs"""
+
+class ThreatDef(NamedTuple):
+    """Threat level and description of a suspicious PDF keyword"""
+    level: ThreatLevel
+    desc: str
+
+# Batch scans can create many results; slots drop the per-instance __dict__ on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class ScanResult:
     file_path: Path
     success: bool
     threat_level: ThreatLevel
     summary: str
     details: Dict[str, int]
-    recommendations: List[str]
+    recommendations: Sequence[str]
     error_message: Optional[str] = None
     scan_time: float = 0.0
+    
+    def to_dict(self) -> dict:
+        """JSON-serializable form of the result, without the file path or timing"""
+        return {
+            "success": self.success,
+            "threat_level": int(self.threat_level),
+            "summary": self.summary,
+            "details": dict(self.details),
+            "recommendations": list(self.recommendations),
+            "error_message": self.error_message
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict, file_path: Path) -> "ScanResult":
+        """Rebuild a result stored with to_dict for the given file"""
+        return cls(
+            file_path=file_path,
+            success=data["success"],
+            threat_level=ThreatLevel(data["threat_level"]),
+            summary=data["summary"],
+            details=data["details"],
+            recommendations=tuple(data["recommendations"]),
+            error_message=data["error_message"]
+        )
+
+class _PdfidOutput(NamedTuple):
+    """Exit status and raw output of a pdfid subprocess run"""
+    returncode: int
+    stdout: bytes
+    stderr: bytes
 
 class PDFScanner:
     """Cross-platform PDF scanner with multi-core processing and 1GB file size limit"""
@@ -37,35 +181,206 @@ class PDFScanner:
     WARNING_FILE_SIZE_MB = 100  # Warning threshold
     LARGE_FILE_SIZE_MB = 500   # Large file threshold
     
+    # Files at least this large also have their results cached on disk by content hash,
+    # so identical bytes are never scanned twice; smaller files are quicker to rescan
+    HASH_CACHE_MIN_SIZE_MB = 5
+    RESULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pdf_scanner"
+    # Bump when threat definitions change so stale results on disk are ignored
+    _RESULT_CACHE_VERSION = 2
+    _HASH_CHUNK_SIZE = 1024 * 1024
+    
+    # PDF header signature and how far into the file readers look for it
+    _PDF_HEADER = b'%PDF-'
+    HEADER_SEARCH_BYTES = 1024
+    
+    # Seconds between cancellation checks while a batch waits for results
+    CANCEL_POLL_INTERVAL = 0.1
+    # Cancellation flags shared with the pool workers; each batch uses the next slot
+    _BATCH_CANCEL_SLOTS = 64
+    
+    # Number of scan results kept in memory, keyed by (path, mtime, size)
+    CACHE_SIZE = 256
+    
+    # An in-process pdfid run can't be interrupted, so it is only used for files small enough
+    # to finish well within their timeout (pdfid reads roughly 1MB/s). Anything else runs in
+    # a subprocess, which is killed when the timeout expires
+    IN_PROCESS_MAX_MB = 2
+    _PDFID_MB_PER_SECOND = 1.0
 
     
     THREAT_DEFINITIONS = {
         # Critical threats - immediate danger
-        "/JS": {"level": ThreatLevel.CRITICAL, "desc": "JavaScript code execution"},
-        "/JavaScript": {"level": ThreatLevel.CRITICAL, "desc": "JavaScript embedded"},
-        "/AA": {"level": ThreatLevel.HIGH, "desc": "Auto-action triggers"},
-        "/OpenAction": {"level": ThreatLevel.HIGH, "desc": "Automatic execution on open"},
+        "/JS": ThreatDef(ThreatLevel.CRITICAL, "JavaScript code execution"),
+        "/JavaScript": ThreatDef(ThreatLevel.CRITICAL, "JavaScript embedded"),
+        "/AA": ThreatDef(ThreatLevel.HIGH, "Auto-action triggers"),
+        "/OpenAction": ThreatDef(ThreatLevel.HIGH, "Automatic execution on open"),
         
         # High risk threats
-        "/Launch": {"level": ThreatLevel.HIGH, "desc": "External program execution"},
-        "/EmbeddedFile": {"level": ThreatLevel.MEDIUM, "desc": "Embedded files present"},
-        "/RichMedia": {"level": ThreatLevel.MEDIUM, "desc": "Rich media content"},
+        "/Launch": ThreatDef(ThreatLevel.HIGH, "External program execution"),
+        "/EmbeddedFile": ThreatDef(ThreatLevel.MEDIUM, "Embedded files present"),
+        "/RichMedia": ThreatDef(ThreatLevel.MEDIUM, "Rich media content"),
         
         # Medium risk
-        "/XFA": {"level": ThreatLevel.MEDIUM, "desc": "XML Forms Architecture"},
-        "/Encrypt": {"level": ThreatLevel.LOW, "desc": "Encrypted content"},
-        "/Names": {"level": ThreatLevel.LOW, "desc": "Named destinations"},
-        "/AcroForm": {"level": ThreatLevel.LOW, "desc": "Interactive forms"}
+        "/XFA": ThreatDef(ThreatLevel.MEDIUM, "XML Forms Architecture"),
+        "/Encrypt": ThreatDef(ThreatLevel.LOW, "Encrypted content"),
+        "/Names": ThreatDef(ThreatLevel.LOW, "Named destinations"),
+        "/AcroForm": ThreatDef(ThreatLevel.LOW, "Interactive forms")
     }
     
-    def __init__(self):
+    # Every keyword that maps to a threat level
+    _THREAT_KEYS = frozenset(THREAT_DEFINITIONS)
+    
+    # Base recommendations per threat level. The tuples are shared by every result,
+    # so additions always build a new tuple
+    _BASE_RECOMMENDATIONS = {
+        ThreatLevel.CRITICAL: (
+            "🚨 CRITICAL THREAT DETECTED - DO NOT OPEN",
+            "This PDF contains dangerous executable code",
+            "Use isolated/sandboxed environment only",
+            "Consider this file potentially malicious"
+        ),
+        ThreatLevel.HIGH: (
+            "⚠️ HIGH RISK - Exercise extreme caution",
+            "Disable JavaScript in PDF viewer",
+            "Scan with updated antivirus software",
+            "Do not enable any prompts or dialogs"
+        ),
+        ThreatLevel.MEDIUM: (
+            "⚠️ Medium risk features detected",
+            "Review embedded content before opening",
+            "Use updated PDF viewer with security features"
+        ),
+        ThreatLevel.LOW: (
+            "Low risk features present",
+            "File appears relatively safe",
+            "Standard PDF viewer precautions apply"
+        ),
+        ThreatLevel.SAFE: (
+            "✅ No obvious threats detected",
+            "File appears clean and safe to open"
+        )
+    }
+    
+    # Summary line per threat level, filled in with the threat count and a size note
+    _SUMMARY_TEMPLATES = {
+        ThreatLevel.SAFE: "✅ Clean - No threats detected{size}",
+        ThreatLevel.LOW: "⚪ Low Risk - {count} minor issue(s) found{size}",
+        ThreatLevel.MEDIUM: "🟡 Medium Risk - {count} concerning feature(s){size}",
+        ThreatLevel.HIGH: "🟠 High Risk - {count} dangerous feature(s){size}",
+        ThreatLevel.CRITICAL: "🔴 CRITICAL - {count} severe threat(s) detected{size}"
+    }
+    
+    # Matches every name pdfid could count as a threat keyword: the literal names, plus any
+    # name using a #xx hex escape (e.g. /J#53), which pdfid decodes before counting
+    _THREAT_PREFILTER_RE = re.compile(
+        rb'/(?:' + b'|'.join(re.escape(keyword[1:].encode()) for keyword in THREAT_DEFINITIONS)
+        + rb'|[A-Za-z0-9]*#[0-9A-Fa-f]{2})'
+    )
+    
+    # One line of pdfid's text report: name, count and an optional "(hexcode count)"
+    _PDFID_LINE_RE = re.compile(rb'^[ \t]*(\S+)[ \t]+(\d+)(?:\(\d+\))?[ \t]*\r?$', re.MULTILINE)
+    
+    def __init__(self, max_tasks_per_child: Optional[int] = 32):
+        """max_tasks_per_child recycles each pool worker after that many scans (Python 3.11+),
+        so memory held by pdfid in long batch runs is returned; None keeps workers for good.
+        
+        Recycled workers are started with the "spawn" method on every platform, so scripts
+        calling scan_multiple_pdfs need the usual if __name__ == "__main__" guard.
+        """
         self.pdfid_path = self._find_pdfid()
-        self.python_executable = self._get_python_executable()
-        self.system = platform.system()
+        self.system = _SYSTEM
         self.CPU_COUNT = multiprocessing.cpu_count()
-        self.MAX_WORKERS = min(6, self.CPU_COUNT)  
-    def _get_python_executable(self) -> str:
-            """Get the correct Python executable, avoiding the bundled app itself."""
+        # Scans run in separate processes, so they aren't bound by the GIL
+        self.MAX_WORKERS = self.CPU_COUNT
+        self._pdfid = self._load_pdfid_module(self.pdfid_path)
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Created on the first batch and reused after that, so scanners that only run
+        # scan_pdf (such as the ones inside pool workers) never start a pool of their own
+        self._pool_kwargs = {}
+        if max_tasks_per_child is not None and sys.version_info >= (3, 11):
+            self._pool_kwargs['max_tasks_per_child'] = max_tasks_per_child
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # Set per batch slot to stop that batch's scans inside the workers
+        self._cancel_flags = None
+        self._batch_ids = itertools.count()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_pdfid_module(pdfid_path: Optional[Path]):
+        """Import pdfid.py in-process so scans don't spawn a new interpreter per file.
+        
+        The module is loaded once per process and shared by every scanner instance.
+        """
+        if not pdfid_path:
+            return None
+        try:
+            # Load under a private name so it can't clash with the src/pdfid package
+            spec = importlib.util.spec_from_file_location("_pdfid", pdfid_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            # pdfid reads pdfid.ini (extra keywords such as /URI) from its script directory,
+            # which it takes from sys.argv[0]; point it at pdfid.py's own directory instead
+            script_dir = str(Path(pdfid_path).parent)
+            module.GetScriptPath = lambda: script_dir
+            return module
+        except Exception:
+            # Fall back to running pdfid.py as a subprocess
+            return None
+
+    def _get_pool(self) -> Tuple[concurrent.futures.ProcessPoolExecutor, Sequence[int]]:
+        """Return the worker pool used by batch scans and its cancel flags, creating them on first use"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._cancel_flags = multiprocessing.RawArray('b', self._BATCH_CANCEL_SLOTS)
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.MAX_WORKERS,
+                    initializer=_worker_init,
+                    initargs=(self._cancel_flags,),
+                    **self._pool_kwargs
+                )
+            return self._pool, self._cancel_flags
+    
+    def _discard_pool(self, pool: concurrent.futures.ProcessPoolExecutor) -> None:
+        """Forget a pool broken by a dead worker, so _get_pool starts a new one"""
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+                self._cancel_flags = None
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _submit_scan(self, file_path: Path, cancel_slot: int) -> concurrent.futures.Future:
+        """Queue one file on the worker pool, replacing the pool if it is broken.
+        
+        A file that can't be queued gets a future holding the error, so the batch reports
+        it like any other failed scan.
+        """
+        for _ in range(2):
+            pool, _ = self._get_pool()
+            try:
+                return pool.submit(_scan_pdf_worker, file_path, cancel_slot)
+            except BrokenProcessPool as e:
+                # A worker died and took the pool with it; retry once on a fresh one
+                self._discard_pool(pool)
+                error = e
+            except RuntimeError as e:
+                # close() shut the pool down while the batch was running
+                error = e
+                break
+        future = concurrent.futures.Future()
+        future.set_exception(error)
+        return future
+
+    @property
+    def python_executable(self) -> str:
+        """Python interpreter for the pdfid subprocess fallback, resolved on first use"""
+        return self._get_python_executable()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_python_executable() -> str:
+            """Get the correct Python executable, avoiding the bundled app itself (resolved once per process)."""
             # When frozen by PyInstaller, sys.executable is the app itself.
             # We must avoid using it and find a real python interpreter.
             is_frozen = getattr(sys, 'frozen', False)
@@ -78,7 +393,7 @@ class PDFScanner:
 
             # Fallback for frozen apps or if sys.executable is not found.
             # Search for a python interpreter on the system's PATH.
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 candidates = ["python.exe", "python3.exe"]
             else:
                 candidates = ["python3", "python"]
@@ -93,86 +408,64 @@ class PDFScanner:
                 "Python is required to run the scanner."
             )
     
-    def _find_pdfid(self) -> Optional[Path]:
-        """Find pdfid.py with cross-platform path resolution"""
-        base_dir = Path(__file__).parent
-        
-        # Common relative paths
-        relative_paths = [
-            "src/pdfid/pdfid.py",
-            "pdfid/pdfid.py",
-            "../src/pdfid/pdfid.py",
-            "../pdfid/pdfid.py",
-            "tools/pdfid.py",
-            "scripts/pdfid.py"
-        ]
-        
-        # Check relative paths first
-        for rel_path in relative_paths:
-            path = base_dir / rel_path
-            if path.exists():
-                return path
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _find_pdfid() -> Optional[Path]:
+        """Find pdfid.py with cross-platform path resolution (resolved once per process)"""
+        # An explicit location always wins
+        env_path = os.environ.get("PDFID_PATH")
+        if env_path and os.path.isfile(env_path):
+            return Path(env_path)
+        
+        which_path = shutil.which("pdfid.py")
+        if which_path:
+            return Path(which_path)
+        
+        # Common relative paths, checked first
+        path = _probe_relative_candidates(Path(__file__).parent, _RELATIVE_PDFID_CANDIDATES)
+        if path:
+            return path
         
         # Platform-specific system paths
-        if platform.system() == "Windows":
-            system_paths = [
-                Path.home() / "pdfid" / "pdfid.py",
-                Path("C:/Tools/pdfid/pdfid.py"),
-                Path("C:/Program Files/pdfid/pdfid.py"),
-                Path("C:/Program Files (x86)/pdfid/pdfid.py")
-            ]
-        elif platform.system() == "Darwin":  # macOS
-            system_paths = [
-                Path.home() / "pdfid" / "pdfid.py",
-                Path("/usr/local/bin/pdfid.py"),
-                Path("/opt/homebrew/bin/pdfid.py"),
-                Path("/Applications/pdfid/pdfid.py")
-            ]
+        if _IS_WINDOWS:
+            system_paths = _WINDOWS_PDFID_PATHS
+        elif _IS_MAC:  # macOS
+            system_paths = _MAC_PDFID_PATHS
         else:  # Linux and other Unix-like systems
-            system_paths = [
-                Path.home() / "pdfid" / "pdfid.py",
-                Path("/usr/local/bin/pdfid.py"),
-                Path("/opt/pdfid/pdfid.py"),
-                Path("/usr/bin/pdfid.py")
-            ]
-        
-        for path in system_paths:
-            if path.exists():
+            system_paths = _UNIX_PDFID_PATHS
+        
+        for path in (Path.home() / "pdfid" / "pdfid.py",) + system_paths:
+            if path.is_file():
                 return path
         
         return None
     
-    def _calculate_timeout(self, file_size_mb: float) -> int:
+    @staticmethod
+    def _calculate_timeout(file_size_mb: float) -> int:
         """Calculate appropriate timeout based on file size"""
-        if file_size_mb <= 10:
-            return 30
-        elif file_size_mb <= 100:
-            return 60
-        elif file_size_mb <= 500:
-            return 180
-        else:
-            return 300
+        return _TIMEOUT_SECONDS[bisect.bisect_left(_TIMEOUT_LIMITS_MB, file_size_mb)]
     
-    def _set_process_priority(self, file_size_mb: float) -> None:
-        """Set process priority in a cross-platform way"""
+    def _set_process_priority(self, pid: int, file_size_mb: float) -> None:
+        """Lower the priority of a spawned pdfid process in a cross-platform way"""
         try:
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 import psutil
-                process = psutil.Process()
+                process = psutil.Process(pid)
                 if file_size_mb > self.LARGE_FILE_SIZE_MB:
                     process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
                 else:
                     process.nice(psutil.NORMAL_PRIORITY_CLASS)
             else:
-                # Unix-like systems
-                if hasattr(os, 'nice'):
-                    nice_value = 5 if file_size_mb > self.LARGE_FILE_SIZE_MB else 10
-                    os.nice(nice_value)
+                # Unix-like systems: renice the child from the parent so the
+                # spawn itself needs no Python code between fork and exec
+                nice_value = 5 if file_size_mb > self.LARGE_FILE_SIZE_MB else 10
+                os.setpriority(os.PRIO_PROCESS, pid, nice_value)
         except (ImportError, OSError, AttributeError):
             # If we can't set priority, just continue
             pass
     
-    def scan_pdf(self, file_path: Path, timeout: int = None, progress_callback: Optional[Callable[[str], None]] = None) -> ScanResult:
+    def scan_pdf(self, file_path: Path, timeout: int = None, progress_callback: Optional[Callable[[str], None]] = None,
+                 cancel_token: Optional[CancellationToken] = None) -> ScanResult:
         """Scan PDF with cross-platform compatibility and enhanced error handling"""
         start_time = time.time()
         
@@ -180,11 +473,27 @@ class PDFScanner:
         if isinstance(file_path, str):
             file_path = Path(file_path)
         
-        if progress_callback:
-            progress_callback("Validating file...")
+        if progress_callback is None:
+            progress_callback = _NOOP
+        
+        progress_callback("Validating file...")
+        
+        # File type validation
+        if file_path.suffix.lower() != '.pdf':
+            return ScanResult(
+                file_path=file_path,
+                success=False,
+                threat_level=ThreatLevel.SAFE,
+                summary="Invalid file type",
+                details={},
+                recommendations=[],
+                error_message="File is not a PDF document"
+            )
         
-        # File existence check
-        if not file_path.exists():
+        # A single open covers the existence check, stat, header check and prefilter
+        try:
+            pdf_file = open(file_path, 'rb', buffering=0)
+        except FileNotFoundError:
             return ScanResult(
                 file_path=file_path,
                 success=False,
@@ -194,22 +503,28 @@ class PDFScanner:
                 recommendations=[],
                 error_message=f"File does not exist: {file_path}"
             )
-        
-        # File type validation
-        if file_path.suffix.lower() != '.pdf':
+        except OSError as e:
             return ScanResult(
                 file_path=file_path,
                 success=False,
                 threat_level=ThreatLevel.SAFE,
-                summary="Invalid file type",
+                summary="File access error",
                 details={},
                 recommendations=[],
-                error_message="File is not a PDF document"
+                error_message=f"Cannot access file: {str(e)}"
             )
         
+        with pdf_file:
+            return self._scan_open_file(pdf_file, file_path, start_time, timeout, progress_callback, cancel_token)
+    
+    def _scan_open_file(self, pdf_file, file_path: Path, start_time: float, timeout: Optional[int],
+                        progress_callback: Callable[[str], None],
+                        cancel_token: Optional[CancellationToken]) -> ScanResult:
+        """Validate and scan a PDF file that scan_pdf has already opened"""
         # File size validation
         try:
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
+            file_stat = os.fstat(pdf_file.fileno())
+            file_size_mb = file_stat.st_size / (1024 * 1024)
             
             if file_size_mb > self.MAX_FILE_SIZE_MB:
                 return ScanResult(
@@ -227,18 +542,23 @@ class PDFScanner:
                     error_message=f"File size ({file_size_mb:.1f}MB) exceeds maximum allowed size ({self.MAX_FILE_SIZE_MB}MB)"
                 )
             
+            # Unchanged files return the result of their previous scan
+            cache_key = self._cache_key(file_path, file_stat)
+            cached_result = self._get_cached_result(cache_key, file_path)
+            if cached_result is not None:
+                return cached_result
+            
             if timeout is None:
                 timeout = self._calculate_timeout(file_size_mb)
             
             # Progress messages for large files
             if file_size_mb > self.LARGE_FILE_SIZE_MB:
-                if progress_callback:
-                    progress_callback(f"Very large file detected ({file_size_mb:.1f}MB) - this will take several minutes...")
+                progress_callback(f"Very large file detected ({file_size_mb:.1f}MB) - this will take several minutes...")
             elif file_size_mb > self.WARNING_FILE_SIZE_MB:
-                if progress_callback:
-                    progress_callback(f"Large file detected ({file_size_mb:.1f}MB) - this may take longer...")
+                progress_callback(f"Large file detected ({file_size_mb:.1f}MB) - this may take longer...")
                 
-        except OSError as e:
+        except (OSError, RuntimeError) as e:
+            # RuntimeError comes from resolving a path caught in a symlink loop
             return ScanResult(
                 file_path=file_path,
                 success=False,
@@ -249,31 +569,67 @@ class PDFScanner:
                 error_message=f"Cannot access file: {str(e)}"
             )
         
-        # Check if pdfid is available
-        if not self.pdfid_path:
-            return ScanResult(
-                file_path=file_path,
-                success=False,
-                threat_level=ThreatLevel.SAFE,
-                summary="Scanner not available",
-                details={},
-                recommendations=[
-                    "Install pdfid tool",
-                    "Download from: https://blog.didierstevens.com/programs/pdf-tools/",
-                    f"Place pdfid.py in one of these locations: {self._get_suggested_paths()}"
-                ],
-                error_message="pdfid.py not found in expected locations"
-            )
-        
-        if progress_callback:
-            progress_callback("Analyzing PDF structure...")
+        progress_callback("Analyzing PDF structure...")
         
         try:
-            # Run pdfid scan
-            result = self._run_pdfid_scan(file_path, timeout, file_size_mb)
+            has_pdf_header, may_contain_threats = self._inspect_file(pdf_file)
+            if not has_pdf_header:
+                return ScanResult(
+                    file_path=file_path,
+                    success=False,
+                    threat_level=ThreatLevel.SAFE,
+                    summary="Invalid PDF file",
+                    details={},
+                    recommendations=[
+                        "File has a .pdf extension but no PDF header",
+                        "It may be misnamed, truncated, or a different file type in disguise",
+                        "Do not open it with a PDF viewer until its real type is known"
+                    ],
+                    error_message="File does not start with a %PDF- header"
+                )
+            
+            # Last chance to stop before the expensive part
+            if cancel_token is not None and cancel_token.cancelled:
+                return self._cancelled_result(file_path)
+            
+            content_digest = None
+            if may_contain_threats:
+                # Large files may have been scanned before under another name or timestamp; hashing
+                # waits for the header check and prefilter, which turn most files away more cheaply
+                if file_size_mb >= self.HASH_CACHE_MIN_SIZE_MB:
+                    try:
+                        content_digest = self._hash_file(pdf_file, cancel_token)
+                    except OSError:
+                        # The disk cache is only an optimization; pdfid reads the file itself
+                        content_digest = None
+                    if content_digest is not None:
+                        stored_result = self._load_stored_result(content_digest, file_path)
+                        if stored_result is not None:
+                            self._cache_result(cache_key, stored_result)
+                            return stored_result
+                
+                # Only files the prefilter can't clear need pdfid
+                if not self.pdfid_path:
+                    return ScanResult(
+                        file_path=file_path,
+                        success=False,
+                        threat_level=ThreatLevel.SAFE,
+                        summary="Scanner not available",
+                        details={},
+                        recommendations=[
+                            "Install pdfid tool",
+                            "Download from: https://blog.didierstevens.com/programs/pdf-tools/",
+                            f"Place pdfid.py in one of these locations: {self._get_suggested_paths()}"
+                        ],
+                        error_message="pdfid.py not found in expected locations"
+                    )
+                # Run pdfid scan
+                keyword_counts, error = self._run_pdfid(file_path, timeout, file_size_mb, cancel_token)
+            else:
+                # No threat keyword occurs anywhere in the file, so pdfid can't find one
+                keyword_counts, error = {}, None
             
-            if result.returncode != 0:
-                stderr_msg = result.stderr.strip() if result.stderr else 'Unknown error'
+            if error is not None:
                 return ScanResult(
                     file_path=file_path,
                     success=False,
@@ -286,25 +642,23 @@ class PDFScanner:
                         "Check if file is password protected",
                         "Large files may require additional processing time"
                     ],
-                    error_message=f"pdfid scan error: {stderr_msg}"
+                    error_message=f"pdfid scan error: {error}"
                 )
             
-            if progress_callback:
-                progress_callback("Analyzing threats and generating report...")
-            
-            # Parse results
-            keyword_counts = self._parse_pdfid_output(result.stdout)
-            threat_level, recommendations = self._assess_threats(keyword_counts)
-            summary = self._generate_summary(keyword_counts, threat_level)
+            progress_callback("Analyzing threats and generating report...")
             
+            # Assess results
             # Add file size info
             keyword_counts["file_size_mb"] = round(file_size_mb, 2)
             if file_size_mb > self.WARNING_FILE_SIZE_MB:
                 keyword_counts["large_file"] = 1
             
+            threat_level, recommendations, threat_count = self._assess_threats(keyword_counts)
+            summary = self._generate_summary(threat_level, threat_count, file_size_mb)
+            
             scan_time = time.time() - start_time
             
-            return ScanResult(
+            result = ScanResult(
                 file_path=file_path,
                 success=True,
                 threat_level=threat_level,
@@ -313,7 +667,13 @@ class PDFScanner:
                 recommendations=recommendations,
                 scan_time=scan_time
             )
+            self._cache_result(cache_key, result)
+            if content_digest is not None:
+                self._store_result(content_digest, result)
+            return result
             
+        except _ScanCancelled:
+            return self._cancelled_result(file_path)
         except subprocess.TimeoutExpired:
             return ScanResult(
                 file_path=file_path,
@@ -346,230 +706,470 @@ class PDFScanner:
                 error_message=f"Scan error: {str(e)}"
             )
     
-    def _run_pdfid_scan(self, file_path: Path, timeout: int, file_size_mb: float) -> subprocess.CompletedProcess:
+    @staticmethod
+    def _cancelled_result(file_path: Path) -> ScanResult:
+        return ScanResult(
+            file_path=file_path,
+            success=False,
+            threat_level=ThreatLevel.SAFE,
+            summary="Scan cancelled",
+            details={},
+            recommendations=[],
+            error_message="Scan was cancelled before it finished"
+        )
+    
+    @staticmethod
+    def _cache_key(file_path: Path, file_stat: os.stat_result) -> tuple:
+        """In-memory cache key of a file: (resolved path, mtime, size)"""
+        return (str(file_path.resolve()), file_stat.st_mtime_ns, file_stat.st_size)
+    
+    def _get_cached_result(self, key: tuple, file_path: Path) -> Optional[ScanResult]:
+        """Return a copy of a cached scan result for file_path, or None on a cache miss.
+        
+        The key is the resolved path, so the entry may have been stored under another name
+        for the same file; the copy carries the caller's path and its own details dict.
+        """
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                return None
+            self._cache.move_to_end(key)
+        return replace(cached, file_path=file_path, details=dict(cached.details), scan_time=0.0)
+    
+    def _cache_result(self, key: tuple, result: ScanResult) -> None:
+        """Store a successful scan result, evicting the least recently used entry"""
+        # Keep a private copy of the details, which the caller is free to modify
+        result = replace(result, details=dict(result.details))
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _hash_file(self, pdf_file, cancel_token: Optional[CancellationToken] = None) -> str:
+        """SHA-256 of an open file's contents, leaving it positioned at the start"""
+        pdf_file.seek(0)
+        if hasattr(os, 'posix_fadvise'):
+            # Let the kernel read ahead aggressively; pdfid then reads the same pages from cache
+            try:
+                os.posix_fadvise(pdf_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        digest = hashlib.sha256()
+        buffer = bytearray(self._HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            if cancel_token is not None and cancel_token.cancelled:
+                raise _ScanCancelled()
+            read = pdf_file.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+        pdf_file.seek(0)
+        return digest.hexdigest()
+    
+    def _stored_result_path(self, content_digest: str) -> Path:
+        return self.RESULT_CACHE_DIR / f"v{self._RESULT_CACHE_VERSION}-{content_digest}.json"
+    
+    def _load_stored_result(self, content_digest: str, file_path: Path) -> Optional[ScanResult]:
+        """Return the on-disk result for this content, or None if there isn't a usable one"""
+        try:
+            with open(self._stored_result_path(content_digest), encoding="utf-8") as f:
+                return ScanResult.from_dict(json.load(f), file_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _store_result(self, content_digest: str, result: ScanResult) -> None:
+        """Save a result on disk; written atomically since worker processes share the directory"""
+        path = self._stored_result_path(content_digest)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(result.to_dict(), f)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError):
+            # The disk cache is only an optimization
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    def _inspect_file(self, pdf_file) -> Tuple[bool, bool]:
+        """Check the PDF header and prefilter for threat names on an open file.
+        
+        Returns (has_pdf_header, may_contain_threats).
+        """
+        try:
+            # Readers accept the %PDF- header anywhere in the first 1024 bytes
+            if self._PDF_HEADER not in pdf_file.read(self.HEADER_SEARCH_BYTES):
+                return False, False
+            with mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return True, self._THREAT_PREFILTER_RE.search(mm) is not None
+        except (OSError, ValueError):
+            # Unreadable or unmappable files are left to pdfid
+            return True, True
+    
+    def _run_pdfid(self, file_path: Path, timeout: int, file_size_mb: float,
+                   cancel_token: Optional[CancellationToken] = None) -> Tuple[Dict[str, int], Optional[str]]:
+        """Run pdfid and return (keyword_counts, error_message)"""
+        if self._pdfid is not None and self._fits_in_process(file_size_mb, timeout):
+            return self._run_pdfid_in_process(file_path)
+        
+        result = self._run_pdfid_scan(file_path, timeout, file_size_mb, cancel_token)
+        if result.returncode != 0:
+            stderr_msg = result.stderr.decode(errors='replace').strip() if result.stderr else ''
+            return {}, stderr_msg or 'Unknown error'
+        return self._parse_pdfid_output(result.stdout), None
+    
+    def _fits_in_process(self, file_size_mb: float, timeout: int) -> bool:
+        """Whether pdfid can safely run in-process, i.e. without a way to stop it at the timeout"""
+        expected_seconds = file_size_mb / self._PDFID_MB_PER_SECOND
+        return file_size_mb <= self.IN_PROCESS_MAX_MB and 2 * expected_seconds <= timeout
+    
+    def _run_pdfid_in_process(self, file_path: Path) -> Tuple[Dict[str, int], Optional[str]]:
+        """Run the imported pdfid module directly on the file"""
+        try:
+            xml_doc = self._pdfid.PDFiD(str(file_path), allNames=False)
+        except SystemExit:
+            # pdfid calls sys.exit() when it cannot open the file
+            return {}, f"Cannot open file: {file_path}"
+        
+        root = xml_doc.documentElement
+        if root.getAttribute("ErrorOccured") == "True":
+            message = root.getAttribute("ErrorMessage").strip()
+            return {}, message.splitlines()[-1] if message else 'Unknown error'
+        return self._counts_from_xml(xml_doc), None
+    
+    @staticmethod
+    def _counts_from_xml(xml_doc) -> Dict[str, int]:
+        """Read keyword counts straight from the pdfid XML document"""
+        return {
+            node.getAttribute("Name"): int(node.getAttribute("Count"))
+            for node in xml_doc.getElementsByTagName("Keyword")
+        }
+    
+    def _run_pdfid_scan(self, file_path: Path, timeout: int, file_size_mb: float,
+                        cancel_token: Optional[CancellationToken] = None) -> _PdfidOutput:
         """Run pdfid scan with cross-platform process management"""
         try:
-            # Set process priority if possible
-            self._set_process_priority(file_size_mb)
-            
             # Build command
             cmd = [self.python_executable, str(self.pdfid_path), str(file_path)]
             
-            # Platform-specific subprocess options
-            subprocess_kwargs = {
-                'capture_output': True,
-                'text': True,
-                'timeout': timeout
-            }
-            
-            if platform.system() == "Windows":
-                # On Windows, prevent console window from appearing
-                subprocess_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-            
-            return subprocess.run(cmd, **subprocess_kwargs)
+            with subprocess.Popen(cmd, **_POPEN_KWARGS) as proc:
+                # Set process priority if possible
+                self._set_process_priority(proc.pid, file_size_mb)
+                deadline = time.monotonic() + timeout
+                while True:
+                    # With a token, wake up regularly to kill pdfid as soon as the scan is cancelled
+                    wait = max(0.0, deadline - time.monotonic())
+                    if cancel_token is not None:
+                        wait = min(wait, self.CANCEL_POLL_INTERVAL)
+                    try:
+                        stdout, stderr = proc.communicate(timeout=wait)
+                        break
+                    except subprocess.TimeoutExpired:
+                        cancelled = cancel_token is not None and cancel_token.cancelled
+                        if not cancelled and time.monotonic() < deadline:
+                            continue
+                        proc.kill()
+                        proc.communicate()
+                        if cancelled:
+                            raise _ScanCancelled() from None
+                        raise
+            # Output stays as raw bytes for _parse_pdfid_output
+            return _PdfidOutput(proc.returncode, stdout, stderr)
             
-        except subprocess.TimeoutExpired:
-            # Re-raise timeout to be handled by caller
+        except (subprocess.TimeoutExpired, _ScanCancelled):
+            # Re-raise timeout and cancellation to be handled by caller
             raise
         except Exception as e:
-            # Create a mock result for error handling
-            class MockResult:
-                def __init__(self, error):
-                    self.returncode = 1
-                    self.stdout = ""
-                    self.stderr = str(error)
-            return MockResult(e)
-    
-    def _parse_pdfid_output(self, output: str) -> Dict[str, int]:
-        """Parse pdfid output with improved error handling"""
-        lines = output.splitlines()
-        keyword_counts = {}
-        
-        # Skip header lines (usually first 2 lines)
-        data_lines = lines[2:] if len(lines) > 2 else lines
-        
-        for line in data_lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            parts = line.split(None, 1)  # Split on whitespace, max 1 split
-            if len(parts) == 2:
-                key, value_str = parts
-                try:
-                    value = int(value_str)
-                    keyword_counts[key] = value
-                except ValueError:
-                    # Skip lines that don't have integer values
-                    continue
-        
-        return keyword_counts
-    
-    def _assess_threats(self, keywords: Dict[str, int]) -> Tuple[ThreatLevel, List[str]]:
-        """Assess threats based on keyword counts"""
-        max_threat_level = ThreatLevel.SAFE
-        threat_count = 0
-        
-        for keyword, count in keywords.items():
-            if count > 0 and keyword in self.THREAT_DEFINITIONS:
-                threat_info = self.THREAT_DEFINITIONS[keyword]
-                threat_level = threat_info["level"]
-                threat_count += 1
-                
-                if self._threat_level_priority(threat_level) > self._threat_level_priority(max_threat_level):
-                    max_threat_level = threat_level
-        
+            return _PdfidOutput(1, b"", str(e).encode())
+    
+    def _parse_pdfid_output(self, output: bytes) -> Dict[str, int]:
+        """Parse pdfid's keyword table in a single regex pass"""
+        # Header lines and names containing spaces don't match, so no skipping is needed
+        return {name.decode('ascii', 'replace'): int(count) for name, count in self._PDFID_LINE_RE.findall(output)}
+    
+    def _assess_threats(self, keywords: Dict[str, int]) -> Tuple[ThreatLevel, Sequence[str], int]:
+        """Assess threats based on keyword counts, returning (level, recommendations, threat count)"""
+        definitions = self.THREAT_DEFINITIONS
+        hits = [keyword for keyword in self._THREAT_KEYS & keywords.keys() if keywords[keyword] > 0]
+        max_threat_level = max((definitions[keyword].level for keyword in hits), default=ThreatLevel.SAFE)
+        threat_count = len(hits)
         recommendations = self._generate_recommendations(max_threat_level, threat_count, keywords)
-        return max_threat_level, recommendations
+        return max_threat_level, recommendations, threat_count
     
-    def _generate_recommendations(self, threat_level: ThreatLevel, threat_count: int, keywords: Dict[str, int]) -> List[str]:
+    def _generate_recommendations(self, threat_level: ThreatLevel, threat_count: int, keywords: Dict[str, int]) -> Sequence[str]:
         """Generate recommendations based on threat level"""
-        base_recommendations = {
-            ThreatLevel.CRITICAL: [
-                "🚨 CRITICAL THREAT DETECTED - DO NOT OPEN",
-                "This PDF contains dangerous executable code",
-                "Use isolated/sandboxed environment only",
-                "Consider this file potentially malicious"
-            ],
-            ThreatLevel.HIGH: [
-                "⚠️ HIGH RISK - Exercise extreme caution",
-                "Disable JavaScript in PDF viewer",
-                "Scan with updated antivirus software",
-                "Do not enable any prompts or dialogs"
-            ],
-            ThreatLevel.MEDIUM: [
-                "⚠️ Medium risk features detected",
-                "Review embedded content before opening",
-                "Use updated PDF viewer with security features",
-                f"{threat_count} concerning feature(s) found"
-            ],
-            ThreatLevel.LOW: [
-                "Low risk features present",
-                "File appears relatively safe",
-                "Standard PDF viewer precautions apply"
-            ],
-            ThreatLevel.SAFE: [
-                "✅ No obvious threats detected",
-                "File appears clean and safe to open"
-            ]
-        }
-        
-        recommendations = base_recommendations.get(threat_level, ["Unknown threat level"])
+        recommendations = self._BASE_RECOMMENDATIONS[threat_level]
+        if threat_level == ThreatLevel.MEDIUM:
+            recommendations += (f"{threat_count} concerning feature(s) found",)
         
         # Add file size specific recommendations
         file_size_mb = keywords.get("file_size_mb", 0)
         if file_size_mb > self.LARGE_FILE_SIZE_MB:
-            recommendations.append(f"📊 Very large file ({file_size_mb:.1f}MB) - ensure sufficient system resources")
-            recommendations.append("Large PDFs may take time to open and may consume significant memory")
+            recommendations += (
+                f"📊 Very large file ({file_size_mb:.1f}MB) - ensure sufficient system resources",
+                "Large PDFs may take time to open and may consume significant memory"
+            )
         elif file_size_mb > self.WARNING_FILE_SIZE_MB:
-            recommendations.append(f"📊 Large file ({file_size_mb:.1f}MB) - may require extra loading time")
+            recommendations += (f"📊 Large file ({file_size_mb:.1f}MB) - may require extra loading time",)
         
         return recommendations
     
-    def scan_multiple_pdfs(self, file_paths: List[Path], progress_callback: Optional[Callable[[str], None]] = None) -> List[ScanResult]:
-        """Scan multiple PDFs with improved error handling"""
-        results = []
+    def scan_multiple_pdfs(self, file_paths: List[Path], progress_callback: Optional[BatchProgressCallback] = None,
+                           cancel_token: Optional[CancellationToken] = None) -> List[Optional[ScanResult]]:
+        """Scan multiple PDFs in parallel worker processes, returning results in input order.
+        
+        Files left unscanned because the batch was cancelled have None in their slot.
+        """
+        results: List[Optional[ScanResult]] = [None] * len(file_paths)
+        with contextlib.closing(self._iter_indexed_scans(file_paths, progress_callback, cancel_token)) as scans:
+            for index, result in scans:
+                results[index] = result
+        return results
+    
+    def iter_scan_multiple_pdfs(self, file_paths: List[Path], progress_callback: Optional[BatchProgressCallback] = None,
+                                cancel_token: Optional[CancellationToken] = None,
+                                idle_callback: Optional[Callable[[], None]] = None) -> Iterator[ScanResult]:
+        """Scan multiple PDFs in parallel, yielding each result as soon as it is ready.
+        
+        Closing the iterator early, or cancelling cancel_token, stops the batch: files that
+        haven't started are dropped, and the iterator ends without waiting for running ones,
+        which the workers abandon at their next cancellation check.
+        
+        idle_callback is called from the iterating thread every CANCEL_POLL_INTERVAL seconds
+        that pass without a result, e.g. to flush results the caller is holding back.
+        """
+        with contextlib.closing(self._iter_indexed_scans(file_paths, progress_callback, cancel_token,
+                                                         idle_callback)) as scans:
+            for _, result in scans:
+                yield result
+    
+    def _iter_indexed_scans(self, file_paths: List[Path], progress_callback: Optional[BatchProgressCallback],
+                            cancel_token: Optional[CancellationToken] = None,
+                            idle_callback: Optional[Callable[[], None]] = None) -> Iterator[Tuple[int, ScanResult]]:
+        """Yield (index into file_paths, result) pairs in completion order"""
+        file_paths = [Path(file_path) for file_path in file_paths]
         total_files = len(file_paths)
         
-        def scan_with_progress(i: int, file_path: Path) -> ScanResult:
-            if progress_callback:
-                progress_callback(f"Scanning {i+1}/{total_files}: {file_path.name}")
-            return self.scan_pdf(
-                file_path, 
-                progress_callback=lambda msg: progress_callback(f"[{i+1}/{total_files}] {msg}") if progress_callback else None
-            )
+        # One stat per file sizes the batch and finds results already cached in this process,
+        # since each worker's own cache only sees the files that worker happened to scan
+        sizes_mb = []
+        cache_keys: List[Optional[tuple]] = []
+        cached_results = []
+        to_scan = []
+        for index, file_path in enumerate(file_paths):
+            try:
+                file_stat = os.stat(file_path)
+                cache_key = self._cache_key(file_path, file_stat)
+            except (OSError, RuntimeError):
+                # scan_pdf reports missing or unreadable files itself
+                sizes_mb.append(0.0)
+                cache_keys.append(None)
+                to_scan.append(index)
+                continue
+            sizes_mb.append(file_stat.st_size / (1024 * 1024))
+            cache_keys.append(cache_key)
+            cached_result = self._get_cached_result(cache_key, file_path)
+            if cached_result is not None:
+                cached_results.append((index, cached_result))
+            else:
+                to_scan.append(index)
+        
+        # Very large files are memory hungry, so fewer of them run side by side. Otherwise
+        # a second file per worker waits in the queue, so no worker idles between results,
+        # while the number of pending submissions stays bounded however long the batch is
+        largest_mb = max((sizes_mb[index] for index in to_scan), default=0.0)
+        if largest_mb < self.LARGE_FILE_SIZE_MB:
+            max_pending = 2 * self.MAX_WORKERS
+        else:
+            max_pending = max(2, self.MAX_WORKERS // 2)
+        
+        # Longest jobs first, so a big file started last doesn't stretch the batch
+        pending = iter(sorted(to_scan, key=sizes_mb.__getitem__, reverse=True))
         
-        # Limit concurrent processing for large files
-        max_concurrent = min(self.MAX_WORKERS, 3)
+        future_to_index = {}
+        # Workers check this batch's flag, so stopping the batch also stops scans already running
+        cancel_slot = next(self._batch_ids) % self._BATCH_CANCEL_SLOTS
+        if to_scan:
+            _, cancel_flags = self._get_pool()
+            cancel_flags[cancel_slot] = 0
+            for index in itertools.islice(pending, max_pending):
+                future_to_index[self._submit_scan(file_paths[index], cancel_slot)] = index
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-            future_to_file = {
-                executor.submit(scan_with_progress, i, file_path): file_path 
-                for i, file_path in enumerate(file_paths)
-            }
+        try:
+            # With a token or an idle callback, wake up regularly during long scans
+            if cancel_token is not None or idle_callback is not None:
+                wait_timeout = self.CANCEL_POLL_INTERVAL
+            else:
+                wait_timeout = None
+            done = 0
+            for index, result in cached_results:
+                if cancel_token is not None and cancel_token.cancelled:
+                    return
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total_files, f"Scanned {done}/{total_files}: {file_paths[index].name}")
+                yield index, result
             
-            for future in concurrent.futures.as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    error_result = ScanResult(
-                        file_path=file_path,
-                        success=False,
-                        threat_level=ThreatLevel.SAFE,
-                        summary="Scan failed",
-                        details={},
-                        recommendations=[],
-                        error_message=f"Failed to scan {file_path.name}: {str(e)}"
-                    )
-                    results.append(error_result)
+            while future_to_index:
+                finished, _ = concurrent.futures.wait(
+                    future_to_index, timeout=wait_timeout, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                if cancel_token is not None and cancel_token.cancelled:
+                    return
+                if not finished and idle_callback is not None:
+                    idle_callback()
+                for future in finished:
+                    index = future_to_index.pop(future)
+                    file_path = file_paths[index]
+                    # Keep the window full while this result is handed out
+                    next_index = next(pending, None)
+                    if next_index is not None:
+                        future_to_index[self._submit_scan(file_paths[next_index], cancel_slot)] = next_index
+                    
+                    try:
+                        result = future.result()
+                        if result.success and cache_keys[index] is not None:
+                            self._cache_result(cache_keys[index], result)
+                    except Exception as e:
+                        result = ScanResult(
+                            file_path=file_path,
+                            success=False,
+                            threat_level=ThreatLevel.SAFE,
+                            summary="Scan failed",
+                            details={},
+                            recommendations=[],
+                            error_message=f"Failed to scan {file_path.name}: {str(e)}"
+                        )
+                    
+                    done += 1
+                    # Progress is reported from this process as each worker finishes
+                    if progress_callback:
+                        progress_callback(done, total_files, f"Scanned {done}/{total_files}: {file_path.name}")
+                    yield index, result
+        finally:
+            # The caller stopped early (e.g. a cancelled GUI scan): drop files not yet started
+            # and tell the workers to abandon the ones in progress
+            # A pool replaced mid-batch has its own flags, so set the current ones
+            cancel_flags = self._cancel_flags
+            if future_to_index and cancel_flags is not None:
+                cancel_flags[cancel_slot] = 1
+            for future in future_to_index:
+                future.cancel()
+    
+    def close(self) -> None:
+        """Shut down the worker processes used by scan_multiple_pdfs; a later batch starts new ones.
         
-        return results
+        Returns without waiting: queued files are dropped and running scans are cancelled,
+        so the workers exit at their next cancellation check.
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+            cancel_flags, self._cancel_flags = self._cancel_flags, None
+        if pool is None:
+            return
+        
+        for slot in range(self._BATCH_CANCEL_SLOTS):
+            cancel_flags[slot] = 1
+        pool.shutdown(wait=False, cancel_futures=True)
     
-    def _threat_level_priority(self, level: ThreatLevel) -> int:
-        """Convert threat level to numeric priority"""
-        priority_map = {
-            ThreatLevel.SAFE: 0,
-            ThreatLevel.LOW: 1,
-            ThreatLevel.MEDIUM: 2,
-            ThreatLevel.HIGH: 3,
-            ThreatLevel.CRITICAL: 4
-        }
-        return priority_map[level]
+    def __enter__(self) -> "PDFScanner":
+        return self
     
-    def _generate_summary(self, keywords: Dict[str, int], threat_level: ThreatLevel) -> str:
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _generate_summary(self, threat_level: ThreatLevel, threat_count: int, file_size_mb: float) -> str:
         """Generate human-readable summary"""
-        threat_count = sum(1 for k, v in keywords.items() 
-                          if v > 0 and k in self.THREAT_DEFINITIONS)
-        
-        file_size_mb = keywords.get("file_size_mb", 0)
         size_indicator = ""
         if file_size_mb > self.LARGE_FILE_SIZE_MB:
             size_indicator = " (Very Large File)"
         elif file_size_mb > self.WARNING_FILE_SIZE_MB:
             size_indicator = " (Large File)"
         
-        summary_map = {
-            ThreatLevel.SAFE: f"✅ Clean - No threats detected{size_indicator}",
-            ThreatLevel.LOW: f"⚪ Low Risk - {threat_count} minor issue(s) found{size_indicator}",
-            ThreatLevel.MEDIUM: f"🟡 Medium Risk - {threat_count} concerning feature(s){size_indicator}",
-            ThreatLevel.HIGH: f"🟠 High Risk - {threat_count} dangerous feature(s){size_indicator}",
-            ThreatLevel.CRITICAL: f"🔴 CRITICAL - {threat_count} severe threat(s) detected{size_indicator}"
-        }
-        
-        return summary_map.get(threat_level, f"Unknown threat level{size_indicator}")
+        template = self._SUMMARY_TEMPLATES.get(threat_level, "Unknown threat level{size}")
+        return template.format(count=threat_count, size=size_indicator)
     
     def _get_suggested_paths(self) -> str:
         """Get suggested installation paths for pdfid.py"""
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             return "C:/Tools/pdfid/, C:/Program Files/pdfid/, or current directory"
-        elif platform.system() == "Darwin":
+        elif _IS_MAC:
             return "/usr/local/bin/, /opt/homebrew/bin/, or ~/pdfid/"
         else:
             return "/usr/local/bin/, /opt/pdfid/, or ~/pdfid/"
 
 
+# Per-process scanner shared by the GUI, the legacy wrapper and pool workers
+_shared_scanner: Optional[PDFScanner] = None
+_shared_scanner_lock = threading.Lock()
+
+
+def get_shared_scanner() -> PDFScanner:
+    """Return this process's shared scanner, creating it on first use
+
+    pdfid is loaded and the worker pool started once, however many batches are scanned.
+    scan_pdf keeps its per-call state local, so the instance is safe to use from several threads.
+    """
+    global _shared_scanner
+    if _shared_scanner is None:
+        # Two threads asking at once must not each build a scanner
+        with _shared_scanner_lock:
+            if _shared_scanner is None:
+                _shared_scanner = PDFScanner()
+    return _shared_scanner
+
+
+# Per-batch cancellation flags of the pool this worker belongs to, set by _worker_init
+_batch_cancel_flags = None
+
+
+class _BatchCancelToken:
+    """Cancellation token of one batch, read from the flags shared with the parent process"""
+    __slots__ = ("_slot",)
+    
+    def __init__(self, slot: int):
+        self._slot = slot
+    
+    @property
+    def cancelled(self) -> bool:
+        return bool(_batch_cancel_flags[self._slot])
+
+
+def _worker_init(cancel_flags) -> None:
+    """Set up a pool worker's scanner, loading pdfid, before its first task arrives"""
+    global _batch_cancel_flags
+    _batch_cancel_flags = cancel_flags
+    get_shared_scanner()
+
+
+def _scan_pdf_worker(file_path: Path, cancel_slot: int, timeout: int = None) -> ScanResult:
+    """Scan a single file inside a worker process of PDFScanner's pool"""
+    return get_shared_scanner().scan_pdf(file_path, timeout, cancel_token=_BatchCancelToken(cancel_slot))
+
+
 # Convenience function for backward compatibility
 def scan_pdf(path: Path, level: int = 2, timeout: int = None) -> str:
     """Legacy function wrapper with cross-platform support"""
-    scanner = PDFScanner()
-    result = scanner.scan_pdf(path, timeout)
+    result = get_shared_scanner().scan_pdf(path, timeout)
     
     if not result.success:
         return f"Error: {result.error_message}"
     
     # Format output similar to original
     output = f"Scan Results for: {result.file_path.name}\n"
-    output += f"Threat Level: {result.threat_level.value.upper()}\n"
+    output += f"Threat Level: {result.threat_level.name}\n"
     output += f"Summary: {result.summary}\n"
     output += f"Scan Time: {result.scan_time:.1f}s\n"
-    output += f"Platform: {platform.system()} {platform.release()}\n\n"
+    output += f"Platform: {_SYSTEM} {platform.release()}\n\n"
     
     output += "Detailed Analysis:\n"
     for keyword, count in result.details.items():
         if keyword in PDFScanner.THREAT_DEFINITIONS:
-            desc = PDFScanner.THREAT_DEFINITIONS[keyword]["desc"]
+            desc = PDFScanner.THREAT_DEFINITIONS[keyword].desc
             output += f"{keyword}: {count} - {desc}\n"
         elif keyword == "file_size_mb":
             output += f"File Size: {count} MB\n"
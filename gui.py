@@ -2,6 +2,12 @@ import sys
 from pathlib import Path
 import webbrowser
 import multiprocessing
+import functools
+import importlib.machinery
+import html
+import threading
+import time
+from contextlib import closing
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QFrame, QFileDialog,
@@ -9,15 +15,15 @@ from PySide6.QtWidgets import (
     QSplitter, QGraphicsOpacityEffect, QDialog, QDialogButtonBox
 )
 from PySide6.QtCore import (
-    Qt, QThread, Signal, QPropertyAnimation,
-    QEasingCurve, QSettings, QRectF, QAbstractAnimation, Property, QUrl, QSize
+    Qt, QObject, QThread, Signal, QPropertyAnimation,
+    QEasingCurve, QSettings, QRectF, QAbstractAnimation, Property, QUrl, QSize, QTimer
 )
-from PySide6.QtGui import QFont, QColor, QPainter, QPen, QIcon, QPixmap, QDesktopServices
+from PySide6.QtGui import QFont, QColor, QPainter, QPen, QIcon, QPixmap, QPixmapCache, QDesktopServices
 from PySide6.QtSvgWidgets import QSvgWidget
 
 # --- Real Backend Integration ---
 try:
-    from backend import PDFScanner, ScanResult, ThreatLevel
+    from backend import CancellationToken, PDFScanner, ScanResult, ThreatLevel, get_shared_scanner
 except ImportError:
     QMessageBox.critical(None, "Backend Error", "Could not find backend.py. Please ensure it's in the same directory as gui.py.")
     sys.exit(1)
@@ -26,6 +32,7 @@ except ImportError:
 APP_VERSION = "4.0.0"
 RELEASE_DATE = "July 2025"
 GITHUB_URL = "https://github.com/ErfanNahidi/pdf_scanner/"
+GITHUB_SVG = '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16"><path fill="{fill}" d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/></svg>'''
 
 class ThemeManager:
     """Manages the application's visual themes."""
@@ -38,12 +45,106 @@ class ThemeManager:
         "light": {ThreatLevel.SAFE:{"bar":"#4caf50"}, ThreatLevel.LOW:{"bar":"#ffc107"}, ThreatLevel.MEDIUM:{"bar":"#ff9800"}, ThreatLevel.HIGH:{"bar":"#ff5722"}, ThreatLevel.CRITICAL:{"bar":"#f44336"}}
     }
 
-    def __init__(self): self.set_theme("dark")
-    def set_theme(self, name): self.theme, self.colors, self.threat_palette = name, self.THEMES[name], self.THREAT_COLORS[name]
-    def get_threat_color(self, level: ThreatLevel): return self.threat_palette.get(level, self.threat_palette[ThreatLevel.LOW])
+    _THEME_CACHE = {}  # theme name -> (colours including derived hover shades, stylesheet fragments)
+
+    def __init__(self): self._emoji_pixmaps, self._github_icons = {}, {}; self.set_theme("dark")
+    def set_theme(self, name):
+        self.theme, self.threat_palette = name, self.THREAT_COLORS[name]
+        if (cached := self._THEME_CACHE.get(name)) is None:
+            colors = self.THEMES[name]
+            colors = dict(colors, accent_hover=QColor(colors['accent']).lighter(110).name(), danger_hover=QColor(colors['danger']).lighter(110).name())
+            cached = self._THEME_CACHE[name] = (colors, self._build_qss(colors, self.threat_palette))
+        self.colors, self.qss = cached
+
+    @staticmethod
+    def _build_qss(colors, threat_palette):
+        accent, accent_fg, danger = colors['accent'], colors['accent_fg'], colors['danger']
+        accent_hover, danger_hover = colors['accent_hover'], colors['danger_hover']
+        def drop_area(border, bg): return f"ModernDropArea{{border:2px dashed {border};border-radius:12px;background-color:{bg};}} QPushButton{{background-color:{accent};color:{accent_fg};border:none;border-radius:8px;}} QPushButton:hover{{background-color:{accent_hover};}}"
+        threat_cards = "".join(
+            f'ThreatCard[threat="{level.name}"] {{ border: 1px solid {palette["bar"]}; }} QLabel#ThreatBadge[threat="{level.name}"] {{ background-color: {palette["bar"]}; }}'
+            for level, palette in threat_palette.items())
+        buttons = f"""
+            QPushButton#CancelButton {{ background-color:{danger}; color:#fff; border-radius:8px; font-weight:bold; }}
+            QPushButton#CancelButton:hover {{ background-color:{danger_hover}; }}
+            QPushButton#AccentButton {{ background-color:{accent}; color:{accent_fg}; border-radius:8px; font-weight:bold; }}
+            QPushButton#AccentButton:hover {{ background-color:{accent_hover}; }}
+        """
+        return {
+            "window": f"""
+            QMainWindow, QWidget {{ background-color:{colors['window_bg']}; color:{colors['primary_text']}; border:none; }}
+            QLabel {{ border: none; background-color: transparent; }}
+            QFrame#Header {{ background-color:{colors['header_bg']}; border-bottom:1px solid {colors['border']}; }}
+            QScrollArea, QScrollArea > QWidget > QWidget {{ background-color:transparent; }}
+            QSplitter::handle {{ background-color:transparent; }}
+            QProgressBar {{ border:none; border-radius:3px; background-color:{colors['content_bg_light']}; }}
+            QProgressBar::chunk {{ background-color:{colors['accent']}; border-radius:3px; }}
+            QFrame#DetailItem {{ background-color:{colors['content_bg_light']}; border-radius:5px; padding:12px; }}
+            QLabel#PlaceholderText {{ color: {colors['secondary_text']}; }}
+            QPushButton#HeaderButton {{ background-color: transparent; border-radius: 20px; }}
+            QPushButton#HeaderButton:hover {{ background-color: {colors['border']}; }}
+            ThreatCard {{ background-color: {colors['content_bg']}; border-radius: 12px; padding: 15px; }}
+            QLabel#ThreatBadge {{ color: #ffffff; padding: 6px 12px; border-radius: 15px; }}
+            QLabel#SecondaryText {{ color: {colors['secondary_text']}; }}
+            QLabel#DangerText {{ color: {colors['danger']}; }}
+            {threat_cards}
+        """ + buttons,
+            "drop_area": drop_area(colors['border'], "transparent"),
+            "drop_area_hover": drop_area(colors['drop_area_border'], colors['drop_area_bg']),
+            "dialog": f"""
+            QDialog {{ background-color: {colors['window_bg']}; color: {colors['primary_text']}; }}
+            QPushButton {{ 
+                background-color: {colors['content_bg_light']}; 
+                color: {colors['primary_text']};
+                border: 1px solid {colors['border']};
+                padding: 8px 16px;
+                border-radius: 8px;
+            }}
+            QPushButton:hover {{ background-color: {colors['border']}; }}
+        """,
+        }
+
+    # Pixmaps are built on first use, once a QApplication exists
+    def threat_pixmap(self, level: ThreatLevel):
+        """Card header emoji, rasterized once per (theme, level); monochrome fallback glyphs take the text colour."""
+        if (pixmap := self._emoji_pixmaps.get(key := (self.theme, level))) is None:
+            pixmap = self._emoji_pixmaps[key] = render_emoji_pixmap(THREAT_EMOJIS[level], 40, 24, self.colors['primary_text'])
+        return pixmap
+
+    def github_icon(self):
+        """GitHub logo tinted with the current theme's text colour."""
+        if (icon := self._github_icons.get(self.theme)) is None:
+            pixmap = QPixmap(); pixmap.loadFromData(GITHUB_SVG.format(fill=self.colors['primary_text']).encode('utf-8'))
+            icon = self._github_icons[self.theme] = QIcon(pixmap)
+        return icon
 
 theme_manager = ThemeManager()
 
+THREAT_EMOJIS = {ThreatLevel.SAFE: "🛡️", ThreatLevel.LOW: "🔔", ThreatLevel.MEDIUM: "⚠️", ThreatLevel.HIGH: "🔥", ThreatLevel.CRITICAL: "💀"}
+
+def render_emoji_pixmap(text, size, point_size, color=None):
+    """Paint an emoji onto a transparent square pixmap, sharp on high-DPI screens; results are kept in QPixmapCache."""
+    ratio = QApplication.instance().devicePixelRatio()
+    key = f"emoji:{text}:{size}:{point_size}:{color}:{ratio}"
+    if (pixmap := QPixmapCache.find(key)) is not None: return pixmap
+    pixmap = QPixmap(round(size * ratio), round(size * ratio)); pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    p = QPainter(pixmap); p.setFont(_font("Segoe UI Emoji", point_size))
+    if color: p.setPen(QColor(color))
+    p.drawText(QRectF(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, text); p.end()
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+@functools.lru_cache(maxsize=None)
+def app_settings():
+    """The one QSettings instance; Qt batches its writes and flushes them from the event loop."""
+    return QSettings("MyCompany", "PDFScanner")
+
+@functools.lru_cache(maxsize=None)
+def _font(family, size, weight=None):
+    """Shared QFont per (family, size, weight); widgets copy fonts, so one instance serves all of them."""
+    return QFont(family, size) if weight is None else QFont(family, size, weight)
+
 class AboutDialog(QDialog):
     """A custom dialog to show application information."""
     def __init__(self, parent=None):
@@ -58,10 +159,10 @@ class AboutDialog(QDialog):
         layout.setSpacing(15)
         layout.setContentsMargins(20, 20, 20, 20)
 
-        title = QLabel("PDF Threat Scanner"); title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold)); title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title = QLabel("PDF Threat Scanner"); title.setFont(_font("Segoe UI", 16, QFont.Weight.Bold)); title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        creator = QLabel(f"Created by: Erfan Nahidi"); creator.setFont(QFont("Segoe UI", 11)); creator.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version = QLabel(f"Version: {APP_VERSION} ({RELEASE_DATE})"); version.setFont(QFont("Segoe UI", 10)); version.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        creator = QLabel(f"Created by: Erfan Nahidi"); creator.setFont(_font("Segoe UI", 11)); creator.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        version = QLabel(f"Version: {APP_VERSION} ({RELEASE_DATE})"); version.setFont(_font("Segoe UI", 10)); version.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         github_btn = self.create_github_button()
         
@@ -77,41 +178,23 @@ class AboutDialog(QDialog):
     def create_github_button(self):
         github_btn = QPushButton(" View on GitHub")
         github_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        github_btn.setFont(QFont("Segoe UI", 10))
+        github_btn.setFont(_font("Segoe UI", 10))
         github_btn.setIconSize(QSize(24, 24))
         github_btn.clicked.connect(lambda: QDesktopServices.openUrl(QUrl(GITHUB_URL)))
         self.github_button = github_btn # Store for theme updates
         return github_btn
 
     def update_stylesheet(self):
-        colors = theme_manager.colors
-        self.setStyleSheet(f"""
-            QDialog {{ background-color: {colors['window_bg']}; color: {colors['primary_text']}; }}
-            QPushButton {{ 
-                background-color: {colors['content_bg_light']}; 
-                color: {colors['primary_text']};
-                border: 1px solid {colors['border']};
-                padding: 8px 16px;
-                border-radius: 8px;
-            }}
-            QPushButton:hover {{ background-color: {colors['border']}; }}
-        """)
-        
-        # Update GitHub icon color based on theme
-        svg_data = f"""
-        <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16">
-          <path fill="{colors['primary_text']}" d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/>
-        </svg>
-        """.encode('utf-8')
-        pixmap = QPixmap()
-        pixmap.loadFromData(svg_data)
-        self.github_button.setIcon(QIcon(pixmap))
+        self.setStyleSheet(theme_manager.qss["dialog"])
+        self.github_button.setIcon(theme_manager.github_icon())
 
 class ThemeToggle(QPushButton):
     """A custom animated toggle switch for changing themes."""
     theme_changed = Signal(str)
+    _TRACK_ON, _TRACK_OFF, _KNOB = QColor("#5865f2"), QColor("#747f8d"), QColor("#ffffff")
+    _ICON_PEN_ON, _ICON_PEN_OFF = QPen(QColor("#1e2124")), QPen(QColor("#ffffff"))
     def __init__(self, parent=None):
-        super().__init__(parent); self.setCheckable(True); self.setChecked(theme_manager.theme == "dark"); self.setFixedSize(60, 30); self.setCursor(Qt.CursorShape.PointingHandCursor)
+        super().__init__(parent); self._icon_font = _font("Segoe UI Symbol",10); self._knob_rect = QRectF(0,3,24,24); self.setCheckable(True); self.setChecked(theme_manager.theme == "dark"); self.setFixedSize(60, 30); self.setCursor(Qt.CursorShape.PointingHandCursor)
         self._knob_position = 32 if self.isChecked() else 4
         self.knob_anim = QPropertyAnimation(self, b"knob_position", self); self.knob_anim.setDuration(200); self.knob_anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
         self.toggled.connect(self._on_toggle)
@@ -123,35 +206,105 @@ class ThemeToggle(QPushButton):
     def knob_position(self, pos): self._knob_position = pos; self.update()
 
     def paintEvent(self, event):
-        p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        track = QColor("#5865f2") if self.isChecked() else QColor("#747f8d"); knob, icon = QColor("#ffffff"), QColor("#1e2124") if self.isChecked() else QColor("#ffffff")
-        p.setPen(Qt.PenStyle.NoPen); p.setBrush(track); p.drawRoundedRect(0,0,self.width(),self.height(),15,15)
-        rect = QRectF(self.knob_position-2,3,24,24)
-        p.setBrush(knob); p.drawEllipse(rect)
-        font = QFont("Segoe UI Symbol",10); p.setFont(font); p.setPen(QPen(icon)); p.drawText(rect, Qt.AlignmentFlag.AlignCenter, "🌙" if self.isChecked() else "☀️")
+        # Paint objects are built once; this runs on every frame of the knob animation
+        checked = self.isChecked(); p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(Qt.PenStyle.NoPen); p.setBrush(self._TRACK_ON if checked else self._TRACK_OFF); p.drawRoundedRect(0,0,self.width(),self.height(),15,15)
+        self._knob_rect.moveLeft(self.knob_position-2)
+        p.setBrush(self._KNOB); p.drawEllipse(self._knob_rect)
+        p.setFont(self._icon_font); p.setPen(self._ICON_PEN_ON if checked else self._ICON_PEN_OFF); p.drawText(self._knob_rect, Qt.AlignmentFlag.AlignCenter, "🌙" if checked else "☀️")
 
 class ScanWorker(QThread):
     """Worker thread that uses the real PDFScanner from backend.py."""
-    scan_complete = Signal(ScanResult); progress_update = Signal(str, int); scan_error = Signal(str); finished = Signal(int)
+    RESULT_BATCH_SIZE = 16; RESULT_BATCH_INTERVAL = 0.2  # seconds
+    MAX_PENDING_BATCHES = 4  # batches emitted but not yet turned into cards
+    PROGRESS_INTERVAL = 0.05  # minimum seconds between progress signals
+    scan_batch_complete = Signal(list); progress_update = Signal(str, int); scan_error = Signal(str); finished = Signal(int)
     def __init__(self, scanner: PDFScanner, file_paths: list[Path]):
         super().__init__()
         self.scanner = scanner
         self.file_paths = file_paths
-        self._is_cancelled = False
+        self._cancel_token = CancellationToken()
+        self._last_progress_emit, self._held_progress = 0.0, None
+        self._pending_results, self._last_results_emit = [], time.monotonic()
+        self._batch_slots = threading.Semaphore(self.MAX_PENDING_BATCHES)
 
     def run(self):
         total = len(self.file_paths)
-        for i, path in enumerate(self.file_paths):
-            if self._is_cancelled: break
-            self.progress_update.emit(f"Scanning [{i+1}/{total}]: {path.name}", int(((i + 1) / total) * 100))
-            try:
-                result = self.scanner.scan_pdf(path)
-                self.scan_complete.emit(result)
-            except Exception as e:
-                self.scan_error.emit(f"An unexpected error occurred during scan of {path.name}: {e}")
-        if not self._is_cancelled: self.finished.emit(total)
-
-    def cancel(self): self._is_cancelled = True
+        self.progress_update.emit(f"Scanning {total} file(s)...", 0)
+        try:
+            # The scanner fans the files out over its worker processes; results arrive as each one finishes
+            # Cancelling the token stops the batch: unstarted files are dropped and the workers stop running scans,
+            # killing pdfid for large files; a small file already being read in-process finishes first
+            # Results are handed to the GUI in groups so a burst of fast files costs one layout pass, not one per card;
+            # the scanner calls _flush_due_results while it waits, so a group never sits behind a slow file
+            batch = self.scanner.iter_scan_multiple_pdfs(self.file_paths, self._on_batch_progress, self._cancel_token, self._flush_due_results)
+            with closing(batch) as results:
+                for result in results:
+                    if self._cancel_token.cancelled: break
+                    self._pending_results.append(result)
+                    if len(self._pending_results) >= self.RESULT_BATCH_SIZE: self._flush_results()
+                    else: self._flush_due_results()
+        except Exception as e:
+            self.scan_error.emit(f"An unexpected error occurred during scan: {e}")
+        if self._pending_results and not self._cancel_token.cancelled: self._flush_results()
+        if not self._cancel_token.cancelled: self.finished.emit(total)
+
+    def _flush_due_results(self):
+        now = time.monotonic()
+        if self._pending_results and now - self._last_results_emit >= self.RESULT_BATCH_INTERVAL: self._flush_results()
+        if self._held_progress is not None and now - self._last_progress_emit >= self.PROGRESS_INTERVAL: self._emit_progress()
+
+    def _flush_results(self):
+        results, self._pending_results = self._pending_results, []
+        self._emit_batch(results); self._last_results_emit = time.monotonic()
+
+    def _emit_batch(self, results):
+        # Wait while the GUI is behind on building cards; the scan iterator is not advanced meanwhile,
+        # so no new files are submitted and finished results do not pile up in memory
+        while not self._batch_slots.acquire(timeout=PDFScanner.CANCEL_POLL_INTERVAL):
+            if self._cancel_token.cancelled: return
+        self.scan_batch_complete.emit(results)
+
+    def batch_consumed(self): self._batch_slots.release()
+
+    def _on_batch_progress(self, current: int, total: int, message: str):
+        # At most one signal per interval however fast files finish; a held update goes out with the next one
+        # or from _flush_due_results, and the final update always goes through
+        self._held_progress = (message, current * 100 // total)
+        if current == total or time.monotonic() - self._last_progress_emit >= self.PROGRESS_INTERVAL: self._emit_progress()
+
+    def _emit_progress(self):
+        message, percent = self._held_progress; self._held_progress = None
+        self._last_progress_emit = time.monotonic(); self.progress_update.emit(message, percent)
+
+    def cancel(self): self._cancel_token.cancel()
+
+class _Animator(QObject):
+    """One expand/collapse animation shared by all cards, instead of a QPropertyAnimation per card."""
+    _instance = None
+
+    @classmethod
+    def shared(cls):
+        if cls._instance is None: cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._anim = QPropertyAnimation(self); self._anim.setDuration(350); self._anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        self._anim.finished.connect(self._on_finished); self._done_cb = None
+
+    def animate(self, widget, prop, start, end, done_cb=None):
+        if self._anim.state() == QAbstractAnimation.State.Running:
+            # Another card is still moving: snap it to its final state before retargeting
+            self._anim.setCurrentTime(self._anim.duration())
+        self._anim.setTargetObject(widget); self._anim.setPropertyName(prop); self._anim.setStartValue(start); self._anim.setEndValue(end)
+        self._done_cb = done_cb; self._anim.start()
+
+    def _on_finished(self):
+        done_cb, self._done_cb = self._done_cb, None
+        try:
+            if done_cb: done_cb()
+        except RuntimeError: pass  # the card was deleted while animating
 
 class ThreatCard(QFrame):
     """Card widget with the user-preferred detailed UI and animations."""
@@ -160,28 +313,25 @@ class ThreatCard(QFrame):
         self.result = result
         self.details_expanded = False
         self.toggle_btn = None
+        self._has_shadow = False  # the window installs shadows only on cards near the viewport
         self._init_ui()
-        self.setup_animations()
 
     def _init_ui(self):
         self.setFrameStyle(QFrame.Shape.NoFrame)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        
-        while self.layout() and self.layout().count():
-            item = self.layout().takeAt(0)
-            if widget := item.widget(): widget.deleteLater()
 
         card_layout = QVBoxLayout(self); card_layout.setSpacing(16)
-        self.update_stylesheet()
+        # Colours come from the window's stylesheet, selected by this property
+        self.setProperty("threat", self.result.threat_level.name)
         
         card_layout.addWidget(self.create_header())
         card_layout.addWidget(self.create_summary_section())
         self.details_widget = QWidget()
         self.details_layout = QVBoxLayout(self.details_widget)
         self.details_layout.setContentsMargins(0, 10, 0, 0)
+        self._details_built = False  # details are built on the first expand
         
         if self.result.success and (self.result.details or self.result.recommendations):
-            self.setup_details_section()
             self.toggle_btn = self.create_toggle_button()
             card_layout.addWidget(self.toggle_btn)
             self.details_widget.setVisible(False)
@@ -191,119 +341,120 @@ class ThreatCard(QFrame):
 
         card_layout.addWidget(self.details_widget)
 
-    def update_stylesheet(self):
-        self.threat_colors = theme_manager.get_threat_color(self.result.threat_level)
-        self.setStyleSheet(f"ThreatCard {{ background-color: {theme_manager.colors['content_bg']}; border: 1px solid {self.threat_colors['bar']}; border-radius: 12px; padding: 15px; }}")
-
     def create_header(self):
         header_widget = QWidget()
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(0, 0, 0, 0)
 
-        threat_emojis = {"SAFE": "🛡️", "LOW": "🔔", "MEDIUM": "⚠️", "HIGH": "🔥", "CRITICAL": "💀"}
-        icon = QLabel(threat_emojis.get(self.result.threat_level.value.upper(), "❓")); icon.setFont(QFont("Segoe UI Emoji", 24))
+        self.icon_label = icon = QLabel(); icon.setPixmap(theme_manager.threat_pixmap(self.result.threat_level))
         
         name_container = QVBoxLayout()
-        file_name = QLabel(self.result.file_path.name); file_name.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
-        file_path_label = QLabel(str(self.result.file_path.parent)); file_path_label.setFont(QFont("Segoe UI", 9)); file_path_label.setStyleSheet(f"color: {theme_manager.colors['secondary_text']};")
+        file_name = QLabel(self.result.file_path.name); file_name.setFont(_font("Segoe UI", 14, QFont.Weight.Bold))
+        file_path_label = QLabel(str(self.result.file_path.parent)); file_path_label.setFont(_font("Segoe UI", 9)); file_path_label.setObjectName("SecondaryText")
         name_container.addWidget(file_name); name_container.addWidget(file_path_label)
 
-        badge = QLabel(self.result.threat_level.value.upper()); badge.setAlignment(Qt.AlignmentFlag.AlignCenter); badge.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        badge.setStyleSheet(f"background-color: {self.threat_colors['bar']}; color: #ffffff; padding: 6px 12px; border-radius: 15px;")
+        badge = QLabel(self.result.threat_level.name); badge.setAlignment(Qt.AlignmentFlag.AlignCenter); badge.setFont(_font("Segoe UI", 10, QFont.Weight.Bold))
+        badge.setObjectName("ThreatBadge"); badge.setProperty("threat", self.result.threat_level.name)
 
         header_layout.addWidget(icon); header_layout.addLayout(name_container, 1); header_layout.addWidget(badge)
         return header_widget
 
     def create_summary_section(self):
-        summary_label = QLabel(self.result.summary); summary_label.setFont(QFont("Segoe UI", 11)); summary_label.setWordWrap(True)
-        summary_label.setStyleSheet(f"color: {theme_manager.colors['secondary_text']};")
+        summary_label = QLabel(self.result.summary); summary_label.setFont(_font("Segoe UI", 11)); summary_label.setWordWrap(True)
+        summary_label.setObjectName("SecondaryText")
         return summary_label
 
     def create_error_section(self):
         error_widget = QFrame(); error_widget.setObjectName("DetailItem")
         error_layout = QVBoxLayout(error_widget)
-        error_header = QLabel("❌ Scan Failed"); error_header.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold)); error_header.setStyleSheet(f"color: {theme_manager.colors['danger']};")
+        error_header = QLabel("❌ Scan Failed"); error_header.setFont(_font("Segoe UI", 12, QFont.Weight.Bold)); error_header.setObjectName("DangerText")
         error_label = QLabel(self.result.error_message); error_label.setWordWrap(True)
         error_layout.addWidget(error_header); error_layout.addWidget(error_label)
         return error_widget
 
     def create_toggle_button(self):
-        button = QPushButton("▼ Show Full Report"); button.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold)); button.setCursor(Qt.CursorShape.PointingHandCursor); button.setFixedHeight(35)
-        button.setStyleSheet(f"QPushButton {{ background-color: {theme_manager.colors['accent']}; color: {theme_manager.colors['accent_fg']}; border: none; border-radius: 8px; }} QPushButton:hover {{ background-color: {QColor(theme_manager.colors['accent']).lighter(110).name()}; }}")
+        button = QPushButton("▼ Show Full Report"); button.setFont(_font("Segoe UI", 10, QFont.Weight.Bold)); button.setCursor(Qt.CursorShape.PointingHandCursor); button.setFixedHeight(35)
+        button.setObjectName("AccentButton")
         button.clicked.connect(self.toggle_details)
         return button
         
+    def retheme(self):
+        """Follow a theme change; the window stylesheet restyles everything except the header emoji and the details markup."""
+        self.icon_label.setPixmap(theme_manager.threat_pixmap(self.result.threat_level))
+        if not self._details_built: return
+        while self.details_layout.count():
+            if widget := self.details_layout.takeAt(0).widget(): widget.deleteLater()
+        self.setup_details_section()
+
     def setup_details_section(self):
         if self.result.success and self.result.details: self.create_analysis_details()
         if self.result.recommendations: self.create_recommendations_section()
 
     def create_analysis_details(self):
-        title = QLabel("🔍 Detailed Analysis"); title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold)); self.details_layout.addWidget(title)
-        container = QFrame(); container.setObjectName("DetailItem"); grid_layout = QVBoxLayout(container)
-        
+        title = QLabel("🔍 Detailed Analysis"); title.setFont(_font("Segoe UI", 12, QFont.Weight.Bold)); self.details_layout.addWidget(title)
+        # One rich-text label for the whole table instead of two or three labels per keyword
+        secondary, rows = theme_manager.colors['secondary_text'], []
         for keyword, count in self.result.details.items():
             if keyword == 'large_file' or count == 0: continue
-            
-            item_layout = QHBoxLayout()
-            key_label = QLabel(f"<b>{keyword}</b>"); key_label.setFixedWidth(120)
-            
-            if keyword == 'file_size_mb': value_label = QLabel(f"{count:.2f} MB")
-            else: value_label = QLabel(str(count))
-            
-            item_layout.addWidget(key_label); item_layout.addWidget(value_label, 1)
-            
-            if keyword in self.scanner.THREAT_DEFINITIONS:
-                desc = self.scanner.THREAT_DEFINITIONS[keyword]["desc"]
-                desc_label = QLabel(f"<i>({desc})</i>"); desc_label.setWordWrap(True); desc_label.setStyleSheet(f"color: {theme_manager.colors['secondary_text']};")
-                item_layout.addWidget(desc_label, 2)
-
-            grid_layout.addLayout(item_layout)
-        self.details_layout.addWidget(container)
+            value = f"{count:.2f} MB" if keyword == 'file_size_mb' else str(count)
+            desc = PDFScanner.THREAT_DEFINITIONS[keyword].desc if keyword in PDFScanner.THREAT_DEFINITIONS else None
+            desc_cell = f"<td style='color:{secondary};'><i>({html.escape(desc)})</i></td>" if desc else "<td></td>"
+            rows.append(f"<tr><td width='120'><b>{html.escape(keyword)}</b></td><td>{value}</td>{desc_cell}</tr>")
+        self.details_layout.addWidget(self._rich_text_item(f"<table cellspacing='0' cellpadding='3' width='100%'>{''.join(rows)}</table>"))
 
     def create_recommendations_section(self):
-        title = QLabel("💡 Security Recommendations"); title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold)); self.details_layout.addWidget(title)
+        title = QLabel("💡 Security Recommendations"); title.setFont(_font("Segoe UI", 12, QFont.Weight.Bold)); self.details_layout.addWidget(title)
+        items = "<br>".join(f"• {html.escape(rec)}" for rec in self.result.recommendations)
+        self.details_layout.addWidget(self._rich_text_item(items))
+
+    def _rich_text_item(self, markup):
         container = QFrame(); container.setObjectName("DetailItem"); layout = QVBoxLayout(container)
-        for rec in self.result.recommendations:
-            rec_label = QLabel(f"• {rec}"); rec_label.setWordWrap(True); layout.addWidget(rec_label)
-        self.details_layout.addWidget(container)
+        label = QLabel(markup); label.setTextFormat(Qt.TextFormat.RichText); label.setWordWrap(True); layout.addWidget(label)
+        return container
 
-    def setup_animations(self):
+    def set_shadow(self, enabled):
+        if enabled == self._has_shadow: return
+        self._has_shadow = enabled
+        if not enabled: self.setGraphicsEffect(None); return
         shadow = QGraphicsDropShadowEffect(self); shadow.setBlurRadius(15); shadow.setColor(QColor(0,0,0,60)); shadow.setOffset(0,4); self.setGraphicsEffect(shadow)
-        self.expand_animation = QPropertyAnimation(self.details_widget, b"maximumHeight", self); self.expand_animation.setDuration(350); self.expand_animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
 
     def toggle_details(self):
         if self.details_expanded:
-            self.expand_animation.setStartValue(self.details_widget.height()); self.expand_animation.setEndValue(0)
-            self.expand_animation.finished.connect(lambda: self.details_widget.setVisible(False))
+            _Animator.shared().animate(self.details_widget, b"maximumHeight", self.details_widget.height(), 0, lambda: self.details_widget.setVisible(False))
             self.toggle_btn.setText("▼ Show Full Report")
         else:
+            if not self._details_built:
+                self.setup_details_section(); self._details_built = True
             self.details_widget.setVisible(True)
             target_height = self.details_widget.sizeHint().height()
-            self.expand_animation.setStartValue(0); self.expand_animation.setEndValue(target_height)
+            _Animator.shared().animate(self.details_widget, b"maximumHeight", 0, target_height)
             self.toggle_btn.setText("▲ Hide Full Report")
-        self.expand_animation.start(); self.details_expanded = not self.details_expanded
+        self.details_expanded = not self.details_expanded
 
 class ModernDropArea(QFrame):
     """A stylish area for dragging and dropping files."""
     fileDropped = Signal(list)
-    def __init__(self, parent=None): super().__init__(parent); self.setAcceptDrops(True); self._init_ui()
+    def __init__(self, parent=None): super().__init__(parent); self._pending_files = []; self.setAcceptDrops(True); self._init_ui()
     def _init_ui(self):
         self.setMinimumHeight(250); layout = QVBoxLayout(self); layout.setAlignment(Qt.AlignmentFlag.AlignCenter); layout.setSpacing(15)
-        icon = QLabel("📂"); icon.setFont(QFont("Segoe UI Emoji", 50)); icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        text = QLabel("Drop PDF Files to Scan"); text.setFont(QFont("Segoe UI",20,QFont.Weight.Bold)); text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.browse_btn = QPushButton("Or Browse Files"); self.browse_btn.setFixedSize(200,50); self.browse_btn.setFont(QFont("Segoe UI",11,QFont.Weight.Bold)); self.browse_btn.setCursor(Qt.CursorShape.PointingHandCursor); self.browse_btn.clicked.connect(self.browse_files)
+        icon = QLabel("📂"); icon.setFont(_font("Segoe UI Emoji", 50)); icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.text_label = text = QLabel("Drop PDF Files to Scan"); text.setFont(_font("Segoe UI",20,QFont.Weight.Bold)); text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.browse_btn = QPushButton("Or Browse Files"); self.browse_btn.setFixedSize(200,50); self.browse_btn.setFont(_font("Segoe UI",11,QFont.Weight.Bold)); self.browse_btn.setCursor(Qt.CursorShape.PointingHandCursor); self.browse_btn.clicked.connect(self.browse_files)
         layout.addWidget(icon); layout.addWidget(text); layout.addWidget(self.browse_btn); self.update_style(False)
-    def update_style(self, hovering):
-        color = theme_manager.colors["drop_area_border"] if hovering else theme_manager.colors["border"]; bg = theme_manager.colors["drop_area_bg"] if hovering else "transparent"; accent, accent_fg = theme_manager.colors["accent"], theme_manager.colors["accent_fg"]
-        self.setStyleSheet(f"ModernDropArea{{border:2px dashed {color};border-radius:12px;background-color:{bg};}} QPushButton{{background-color:{accent};color:{accent_fg};border:none;border-radius:8px;}} QPushButton:hover{{background-color:{QColor(accent).lighter(110).name()};}}")
+    def update_style(self, hovering): self.setStyleSheet(theme_manager.qss["drop_area_hover" if hovering else "drop_area"])
+    def set_ready(self, ready):
+        self.setAcceptDrops(ready); self.browse_btn.setEnabled(ready)
+        self.text_label.setText("Drop PDF Files to Scan" if ready else "Initializing scanner…")
     def browse_files(self):
-        settings = QSettings("MyCompany","PDFScanner"); last_dir = settings.value("last_dir",str(Path.home())); files, _ = QFileDialog.getOpenFileNames(self,"Select PDF(s)",last_dir,"PDF Files (*.pdf)")
+        settings = app_settings(); last_dir = settings.value("last_dir",str(Path.home())); files, _ = QFileDialog.getOpenFileNames(self,"Select PDF(s)",last_dir,"PDF Files (*.pdf)")
         if files: settings.setValue("last_dir",str(Path(files[0]).parent)); self.fileDropped.emit([Path(f) for f in files])
     def dragEnterEvent(self, e):
-        if e.mimeData().hasUrls() and any(u.toLocalFile().lower().endswith('.pdf') for u in e.mimeData().urls()): e.acceptProposedAction(); self.update_style(True)
-    def dragLeaveEvent(self, e): self.update_style(False)
+        # Filter the URLs once per drag; dropEvent reuses the list
+        self._pending_files = [Path(u.toLocalFile()) for u in e.mimeData().urls() if u.isLocalFile() and u.toLocalFile().lower().endswith('.pdf')]
+        if self._pending_files: e.acceptProposedAction(); self.update_style(True)
+    def dragLeaveEvent(self, e): self._pending_files = []; self.update_style(False)
     def dropEvent(self, e):
-        self.update_style(False); files = [Path(u.toLocalFile()) for u in e.mimeData().urls() if u.toLocalFile().lower().endswith('.pdf')]
+        self.update_style(False); files, self._pending_files = self._pending_files, []
         if files: self.fileDropped.emit(files)
 
 class PDFThreatScannerApp(QMainWindow):
@@ -311,13 +462,19 @@ class PDFThreatScannerApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self._scan_worker = None
+        self._cards = []  # ThreatCards currently in the results list
         self._is_scanning = False
         self.about_dialog = None # BUG FIX: Initialize before use
         self._load_settings()
-        self.scanner = PDFScanner()
-        ThreatCard.scanner = self.scanner
+        self.scanner = None
         self._init_ui()
         self._apply_theme(theme_manager.theme)
+        # pdfid is located and loaded once the event loop is running, so the window paints first
+        self.drop_area.set_ready(False); QTimer.singleShot(0, self._init_scanner)
+
+    def _init_scanner(self):
+        # Kept on the GUI thread: importing pdfid from a worker thread can crash PySide's import hooks
+        self.scanner = get_shared_scanner(); self.drop_area.set_ready(True)
 
     def _init_ui(self):
         self.setWindowTitle("PDF Threat Scanner"); self.setMinimumSize(800,700); self.resize(1000,800)
@@ -334,11 +491,11 @@ class PDFThreatScannerApp(QMainWindow):
 
     def _create_header_bar(self):
         header = QFrame(); header.setObjectName("Header"); header.setFixedHeight(50); layout = QHBoxLayout(header); layout.setContentsMargins(20,0,10,0)
-        title = QLabel("PDF Threat Scanner"); title.setFont(QFont("Segoe UI",12,QFont.Weight.Bold))
+        title = QLabel("PDF Threat Scanner"); title.setFont(_font("Segoe UI",12,QFont.Weight.Bold))
         
         self.theme_toggle = ThemeToggle(); self.theme_toggle.theme_changed.connect(self._apply_theme)
         
-        about_btn = QPushButton("ℹ️"); about_btn.setFont(QFont("Segoe UI Emoji", 12)); about_btn.setFixedSize(40, 40); about_btn.setObjectName("HeaderButton")
+        about_btn = QPushButton("ℹ️"); about_btn.setFont(_font("Segoe UI Emoji", 12)); about_btn.setFixedSize(40, 40); about_btn.setObjectName("HeaderButton")
         about_btn.setCursor(Qt.CursorShape.PointingHandCursor); about_btn.clicked.connect(self.show_about_dialog)
 
         layout.addWidget(title); layout.addStretch(); layout.addWidget(about_btn); layout.addWidget(self.theme_toggle)
@@ -354,85 +511,119 @@ class PDFThreatScannerApp(QMainWindow):
         self.progress_widget = QWidget(); layout = QVBoxLayout(self.progress_widget); layout.setContentsMargins(0,15,0,0)
         self.status_label = QLabel("Starting scan..."); self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.progress_bar = QProgressBar(); self.progress_bar.setFixedHeight(6); self.progress_bar.setTextVisible(False)
-        self.cancel_btn = QPushButton("Cancel Scan"); self.cancel_btn.setObjectName("CancelButton"); self.cancel_btn.setFixedSize(150,40); self.cancel_btn.setFont(QFont("Segoe UI",10,QFont.Weight.Bold)); self.cancel_btn.clicked.connect(self.cancel_or_clear_scan)
+        self.cancel_btn = QPushButton("Cancel Scan"); self.cancel_btn.setObjectName("CancelButton"); self.cancel_btn.setFixedSize(150,40); self.cancel_btn.setFont(_font("Segoe UI",10,QFont.Weight.Bold)); self.cancel_btn.clicked.connect(self.cancel_or_clear_scan)
         layout.addWidget(self.status_label); layout.addWidget(self.progress_bar); layout.addWidget(self.cancel_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         self.progress_widget.setVisible(False)
+        # Progress signals are only recorded as they arrive; the timer applies the latest one at most every 50ms
+        self._pending_progress = None
+        self._progress_timer = QTimer(self); self._progress_timer.setInterval(50); self._progress_timer.timeout.connect(self._flush_progress)
 
     def _create_results_area(self):
         self.results_area = QWidget(); layout = QVBoxLayout(self.results_area); layout.setContentsMargins(0,15,0,0)
         self.scroll_area = QScrollArea(); self.scroll_area.setWidgetResizable(True); self.scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        self.scroll_content = QWidget(); self.scroll_layout = QVBoxLayout(self.scroll_content); self.scroll_layout.setSpacing(10); self.scroll_layout.addStretch()
-        self.scroll_area.setWidget(self.scroll_content); layout.addWidget(self.scroll_area)
+        self._new_results_content(); layout.addWidget(self.scroll_area)
+        # Drop shadows force software compositing, so only cards within a couple of screens of the viewport get one
+        self._shadow_timer = QTimer(self); self._shadow_timer.setSingleShot(True); self._shadow_timer.setInterval(100); self._shadow_timer.timeout.connect(self._update_card_shadows)
+        scroll_bar = self.scroll_area.verticalScrollBar(); scroll_bar.valueChanged.connect(self._schedule_shadow_update); scroll_bar.rangeChanged.connect(self._schedule_shadow_update)
         self._show_no_results_placeholder()
 
+    def _schedule_shadow_update(self, *_): self._shadow_timer.start()
+
+    def _update_card_shadows(self):
+        top, height = self.scroll_area.verticalScrollBar().value(), self.scroll_area.viewport().height()
+        low, high = top - 2 * height, top + 3 * height
+        for card in self._cards: geometry = card.geometry(); card.set_shadow(geometry.bottom() >= low and geometry.top() <= high)
+
     def _show_no_results_placeholder(self):
         self._clear_results_widgets(); placeholder = QWidget(); layout = QVBoxLayout(placeholder); layout.setAlignment(Qt.AlignmentFlag.AlignCenter); layout.setSpacing(15)
-        icon = QLabel("🔎"); icon.setFont(QFont("Segoe UI Emoji", 50)); text = QLabel("Scan a file to see the results here"); text.setObjectName("PlaceholderText"); text.setFont(QFont("Segoe UI",14,QFont.Weight.Bold))
+        icon = QLabel("🔎"); icon.setFont(_font("Segoe UI Emoji", 50)); text = QLabel("Scan a file to see the results here"); text.setObjectName("PlaceholderText"); text.setFont(_font("Segoe UI",14,QFont.Weight.Bold))
         layout.addWidget(icon); layout.addWidget(text); self.scroll_layout.insertWidget(0, placeholder)
 
+    def _new_results_content(self):
+        self.scroll_content = QWidget(); self.scroll_layout = QVBoxLayout(self.scroll_content); self.scroll_layout.setSpacing(10); self.scroll_layout.addStretch()
+        self.scroll_area.setWidget(self.scroll_content)
+
     def _clear_results_widgets(self):
-        while self.scroll_layout.count() > 1:
-            if widget := self.scroll_layout.takeAt(0).widget(): widget.deleteLater()
+        # Swap in an empty container and let Qt free the old one with every card in it, rather than removing cards one by one
+        self._cards.clear()
+        if old := self.scroll_area.takeWidget(): old.setUpdatesEnabled(False); old.deleteLater()
+        self._new_results_content()
 
     def start_scan(self, file_paths):
-        if self._is_scanning: return
+        if self._is_scanning or self.scanner is None: return
         self._is_scanning = True; self.drop_area.setVisible(False); self.progress_widget.setVisible(True); self._clear_results_widgets()
-        self.status_label.setText("Initializing..."); self.progress_bar.setValue(0); self.cancel_btn.setText("Cancel Scan"); self.cancel_btn.setObjectName("CancelButton"); self._apply_theme_to_buttons()
+        self.status_label.setText("Initializing..."); self.progress_bar.setValue(0); self.cancel_btn.setText("Cancel Scan"); self.cancel_btn.setObjectName("CancelButton"); self._repolish_cancel_button()
         self._scan_worker = ScanWorker(self.scanner, file_paths)
-        self._scan_worker.scan_complete.connect(lambda r: self.scroll_layout.insertWidget(0, ThreatCard(r)))
-        self._scan_worker.progress_update.connect(lambda msg, val: (self.status_label.setText(msg), self.progress_bar.setValue(val)))
-        self._scan_worker.scan_error.connect(lambda e: QMessageBox.critical(self, "Scan Error", e))
-        self._scan_worker.finished.connect(self.on_scan_finished)
-        self._scan_worker.start()
+        # Queued explicitly: emitting must never make the worker wait on the GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self._scan_worker.scan_batch_complete.connect(self._add_result_cards, queued)
+        self._scan_worker.progress_update.connect(self._on_progress, queued)
+        self._scan_worker.scan_error.connect(self._on_scan_error, queued)
+        self._scan_worker.finished.connect(self.on_scan_finished, queued)
+        self._progress_timer.start(); self._scan_worker.start()
+
+    def _add_result_cards(self, results):
+        # Batches a cancelled worker queued before it stopped still arrive; drop them, but free its slot
+        worker = self.sender()
+        if worker is not self._scan_worker:
+            if isinstance(worker, ScanWorker): worker.batch_consumed()
+            return
+        self.scroll_content.setUpdatesEnabled(False); self.scroll_layout.setEnabled(False)
+        for result in results: card = ThreatCard(result); self._cards.append(card); self.scroll_layout.insertWidget(0, card)
+        self.scroll_layout.setEnabled(True); self.scroll_content.setUpdatesEnabled(True); self._schedule_shadow_update()
+        if worker is not None: worker.batch_consumed()
+
+    def _on_scan_error(self, message): QMessageBox.critical(self, "Scan Error", message)
+
+    def _on_progress(self, message, value):
+        if self.sender() is self._scan_worker: self._pending_progress = (message, value)
+
+    def _flush_progress(self):
+        if self._pending_progress is None: return
+        message, value = self._pending_progress; self._pending_progress = None
+        if message != self.status_label.text(): self.status_label.setText(message)
+        if value != self.progress_bar.value(): self.progress_bar.setValue(value)
 
     def on_scan_finished(self, file_count):
+        if self.sender() is not self._scan_worker: return
+        self._progress_timer.stop(); self._flush_progress()
         self._is_scanning = False; self.status_label.setText(f"Scan Complete: {file_count} file(s) analyzed.")
-        self.cancel_btn.setText("Clear & Scan Again"); self.cancel_btn.setObjectName("AccentButton"); self._apply_theme_to_buttons()
+        self.cancel_btn.setText("Clear & Scan Again"); self.cancel_btn.setObjectName("AccentButton"); self._repolish_cancel_button()
 
     def cancel_or_clear_scan(self):
         if self._is_scanning and self._scan_worker: self._scan_worker.cancel(); self._scan_worker.wait()
+        # Signals the old worker already queued are ignored from here on
+        self._scan_worker = None
+        self._progress_timer.stop(); self._pending_progress = None
         self._is_scanning = False; self.progress_widget.setVisible(False); self.drop_area.setVisible(True); self._show_no_results_placeholder()
-        self.cancel_btn.setText("Cancel Scan"); self.cancel_btn.setObjectName("CancelButton"); self._apply_theme_to_buttons()
+        self.cancel_btn.setText("Cancel Scan"); self.cancel_btn.setObjectName("CancelButton"); self._repolish_cancel_button()
 
     def _apply_theme(self, theme_name):
-        theme_manager.set_theme(theme_name); colors = theme_manager.colors
-        self.setStyleSheet(f"""
-            QMainWindow, QWidget {{ background-color:{colors['window_bg']}; color:{colors['primary_text']}; border:none; }}
-            QLabel {{ border: none; background-color: transparent; }}
-            QFrame#Header {{ background-color:{colors['header_bg']}; border-bottom:1px solid {colors['border']}; }}
-            QScrollArea, QScrollArea > QWidget > QWidget {{ background-color:transparent; }}
-            QSplitter::handle {{ background-color:transparent; }}
-            QProgressBar {{ border:none; border-radius:3px; background-color:{colors['content_bg_light']}; }}
-            QProgressBar::chunk {{ background-color:{colors['accent']}; border-radius:3px; }}
-            QFrame#DetailItem {{ background-color:{colors['content_bg_light']}; border-radius:5px; padding:12px; }}
-            QLabel#PlaceholderText {{ color: {colors['secondary_text']}; }}
-            QPushButton#HeaderButton {{ background-color: transparent; border-radius: 20px; }}
-            QPushButton#HeaderButton:hover {{ background-color: {colors['border']}; }}
-        """)
-        self._apply_theme_to_buttons(); self.theme_toggle.setChecked(theme_name == "dark"); self.drop_area.update_style(False)
-        for i in range(self.scroll_layout.count()):
-            if isinstance(widget := self.scroll_layout.itemAt(i).widget(), ThreatCard): widget._init_ui()
+        theme_manager.set_theme(theme_name)
+        # The whole sheet, buttons included, is prebuilt per theme and set in one call; button state changes only repolish
+        self.setStyleSheet(theme_manager.qss["window"]); self.theme_toggle.setChecked(theme_name == "dark"); self.drop_area.update_style(False)
+        for card in self._cards: card.retheme()
         if self.about_dialog: self.about_dialog.update_stylesheet()
 
-    def _apply_theme_to_buttons(self):
-        colors = theme_manager.colors
-        self.setStyleSheet(self.styleSheet() + f"""
-            QPushButton#CancelButton {{ background-color:{colors['danger']}; color:#fff; border-radius:8px; font-weight:bold; }}
-            QPushButton#CancelButton:hover {{ background-color:{QColor(colors['danger']).lighter(110).name()}; }}
-            QPushButton#AccentButton {{ background-color:{colors['accent']}; color:{colors['accent_fg']}; border-radius:8px; font-weight:bold; }}
-            QPushButton#AccentButton:hover {{ background-color:{QColor(colors['accent']).lighter(110).name()}; }}
-        """)
-        for i in range(self.scroll_layout.count()):
-            if isinstance(widget := self.scroll_layout.itemAt(i).widget(), ThreatCard) and widget.toggle_btn:
-                widget.toggle_btn.setStyleSheet(f"QPushButton {{ background-color: {colors['accent']}; color: {colors['accent_fg']}; border: none; border-radius: 8px; font-weight: bold; }} QPushButton:hover {{ background-color: {QColor(colors['accent']).lighter(110).name()}; }}")
-
-    def _load_settings(self): settings = QSettings("MyCompany","PDFScanner"); theme_manager.set_theme(settings.value("theme","dark",type=str))
-    def _save_settings(self): settings = QSettings("MyCompany","PDFScanner"); settings.setValue("theme",theme_manager.theme)
-    def closeEvent(self, e): self._save_settings(); self.cancel_or_clear_scan(); e.accept()
+    def _repolish_cancel_button(self):
+        # Re-match the sheet's #CancelButton/#AccentButton rules after an objectName change
+        style = self.cancel_btn.style(); style.unpolish(self.cancel_btn); style.polish(self.cancel_btn)
+
+    def _load_settings(self): theme_manager.set_theme(app_settings().value("theme","dark",type=str))
+    def _save_settings(self): settings = app_settings(); settings.setValue("theme",theme_manager.theme); settings.sync()
+    def closeEvent(self, e):
+        self._save_settings(); self.cancel_or_clear_scan()
+        # Cancel the workers' running scans now, so the interpreter's exit hook doesn't wait on them
+        if self.scanner is not None: self.scanner.close()
+        e.accept()
 
 if __name__ == "__main__":
     # This guard prevents the app from relaunching itself.
     multiprocessing.freeze_support()
+    # Scan workers are started with "spawn", which re-runs this script in every new worker
+    # unless the main module has a spec to skip. They only need backend.py, so this keeps
+    # PySide6 and the window classes out of them.
+    __spec__ = importlib.machinery.ModuleSpec("__main__", None)
 
     # Application startup code is now directly inside the guard.
     app = QApplication(sys.argv)
@@ -440,13 +631,7 @@ if __name__ == "__main__":
     app.setApplicationName("PDFThreatScanner")
 
     # Create the window icon
-    pixmap = QPixmap(128, 128)
-    pixmap.fill(Qt.GlobalColor.transparent)
-    p = QPainter(pixmap)
-    p.setFont(QFont("Segoe UI Emoji", 80))
-    p.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "🛡️")
-    p.end()
-    app.setWindowIcon(QIcon(pixmap))
+    app.setWindowIcon(QIcon(render_emoji_pixmap("🛡️", 128, 80)))
 
     # Create and show the main window
     window = PDFThreatScannerApp()
@@ -180,7 +180,8 @@ class cBinaryFile:
                 sys.exit()
         else:
             try:
-                self.infile = open(file, "rb")
+                # Large buffer: byte() reads one byte at a time, so keep syscalls rare
+                self.infile = open(file, "rb", buffering=1024 * 1024)
             except:
                 print("Error opening file %s" % file)
                 print(sys.exc_info()[1])